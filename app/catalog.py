@@ -1,12 +1,21 @@
 from __future__ import annotations
 
-import json
-from collections import Counter, defaultdict
+from collections import defaultdict
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, Iterable, List, Optional, Sequence, TypedDict
 
-from .text_utils import cosine_similarity, generate_tokens, normalize_label, trigram_vector
+import orjson
+
+from .text_utils import (
+    MAX_CACHED_TEXT_LENGTH,
+    TrigramVector,
+    cosine_similarity,
+    generate_tokens,
+    normalize_label,
+    trigram_vector,
+)
 
 
 class CatalogItem(TypedDict):
@@ -18,7 +27,7 @@ class CatalogItem(TypedDict):
     aliases: List[str]
 
 
-@dataclass
+@dataclass(slots=True)
 class MatchResult:
     item: CatalogItem
     alias: str
@@ -33,7 +42,7 @@ class AliasRecord:
     alias: str
     normalized: str
     tokens: Sequence[str]
-    vector: Counter[str]
+    vector: TrigramVector
     priority: int
 
 
@@ -155,15 +164,19 @@ class Catalog:
         self._path = Path(path)
         if not self._path.exists():
             raise FileNotFoundError(f"Catalog file not found: {self._path}")
-        with self._path.open("r", encoding="utf-8") as fh:
-            raw_items = list(json.load(fh))
+        raw_items = list(orjson.loads(self._path.read_bytes()))
         raw_items.extend(self._MANUAL_OVERRIDES)
         self.items: Dict[str, CatalogItem] = {}
+        self._normalized_names: Dict[str, str] = {}
+        # Exact-only keys for item ids; kept out of the fuzzy alias records.
+        self._normalized_ids: Dict[str, str] = {}
         self.alias_to_id: Dict[str, str] = {}
         self._alias_records: Dict[str, AliasRecord] = {}
         self._load_items(raw_items)
         self._alias_record_list: Sequence[AliasRecord] = tuple(self._alias_records.values())
         self.category_medoid: Dict[str, str] = self._compute_category_medoids()
+        # Per instance so the cache is released with the catalog.
+        self._best_alias = lru_cache(maxsize=4096)(self._scan_best_alias)
 
     def _register_alias(self, alias: str, item: CatalogItem, *, priority: int) -> None:
         normalized = normalize_label(alias)
@@ -194,6 +207,8 @@ class Catalog:
                 "aliases": list(obj.get("aliases", [])),
             }
             self.items[item["id"]] = item
+            self._normalized_names[item["id"]] = normalize_label(item["name"])
+            self._normalized_ids[normalize_label(item["id"])] = item["id"]
             self._register_alias(item["name"], item, priority=0)
             for alias in item.get("aliases", []):
                 self._register_alias(alias, item, priority=1)
@@ -238,6 +253,9 @@ class Catalog:
     def get(self, item_id: str) -> Optional[CatalogItem]:
         return self.items.get(item_id)
 
+    def normalized_name(self, item_id: str) -> str:
+        return self._normalized_names[item_id]
+
     def alias_records(self) -> Sequence[AliasRecord]:
         return self._alias_record_list
 
@@ -248,19 +266,17 @@ class Catalog:
         normalized = normalize_label(raw)
         if not normalized:
             return None
-        item_id = self.alias_to_id.get(normalized)
-        if item_id:
-            item = self.items[item_id]
-            record = self._alias_records[normalized]
+        record = self._alias_records.get(normalized)
+        if record:
+            item = self.items[record.item_id]
             return MatchResult(item=item, alias=record.alias, normalized=normalized, similarity=1.0)
-        vector = trigram_vector(normalized)
-        best: Optional[AliasRecord] = None
-        best_score = 0.0
-        for record in self._alias_records.values():
-            score = cosine_similarity(vector, record.vector)
-            if score > best_score:
-                best_score = score
-                best = record
+        item_id = self._normalized_ids.get(normalized)
+        if item_id:
+            return MatchResult(item=self.items[item_id], alias=item_id, normalized=normalized, similarity=1.0)
+        if len(normalized) > MAX_CACHED_TEXT_LENGTH:
+            best, best_score = self._scan_best_alias(normalized)
+        else:
+            best, best_score = self._best_alias(normalized)
         if best and best_score >= similarity_threshold:
             item = self.items[best.item_id]
             return MatchResult(
@@ -272,13 +288,24 @@ class Catalog:
             )
         return None
 
+    def _scan_best_alias(self, normalized: str) -> tuple[Optional[AliasRecord], float]:
+        vector = trigram_vector(normalized)
+        best: Optional[AliasRecord] = None
+        best_score = 0.0
+        for record in self._alias_record_list:
+            score = cosine_similarity(vector, record.vector)
+            if score > best_score:
+                best_score = score
+                best = record
+        return best, best_score
+
     def suggest(self, raw: str, *, limit: int = 5) -> List[MatchResult]:
         normalized = normalize_label(raw)
         if not normalized:
             return []
         vector = trigram_vector(normalized)
         scored: List[tuple[float, AliasRecord]] = []
-        for record in self._alias_records.values():
+        for record in self._alias_record_list:
             score = cosine_similarity(vector, record.vector)
             if score <= 0:
                 continue
@@ -5,6 +5,8 @@ from pathlib import Path
 from typing import Dict
 
 from fastapi import APIRouter, HTTPException
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel, Field, field_validator
 
 from .furniture_catalog import FurnitureCatalog
@@ -16,6 +18,8 @@ CATALOG_PATH = BASE_DIR / "data" / "estimation_weights_volumes_categories.json"
 furniture_catalog = FurnitureCatalog(CATALOG_PATH)
 router = APIRouter()
 
+_FRIDAY_OR_SATURDAY = frozenset({4, 5})
+
 
 class EstimateRequest(BaseModel):
     distance_miles: float = Field(..., ge=0)
@@ -27,28 +31,23 @@ class EstimateRequest(BaseModel):
     def validate_items(cls, value: Dict[str, int]) -> Dict[str, int]:
         if not isinstance(value, dict) or not value:
             raise ValueError("items must be a non-empty object")
-        normalized: Dict[str, int] = {}
-        for key, qty in value.items():
-            try:
-                quantity = int(qty)
-            except (TypeError, ValueError):
-                raise ValueError("item quantities must be integers")
-            if quantity < 0:
-                raise ValueError("item quantities must be non-negative")
-            normalized[str(key)] = quantity
-        return normalized
+        # Pydantic has already coerced keys to str and quantities to int.
+        if any(qty < 0 for qty in value.values()):
+            raise ValueError("item quantities must be non-negative")
+        return value
 
 
-@router.post("/estimate")
+@router.post("/estimate", response_class=ORJSONResponse)
 async def create_estimate(payload: EstimateRequest):
     try:
-        total_weight_lbs, breakdown = furniture_catalog.total_weight(payload.items)
+        # Unseen item names fall through to a fuzzy scan of every catalog alias.
+        total_weight_lbs, breakdown = await run_in_threadpool(furniture_catalog.total_weight, payload.items)
     except ValueError as exc:  # pragma: no cover - handled by FastAPI validation
         raise HTTPException(status_code=400, detail=str(exc)) from exc
 
     is_intrastate = payload.distance_miles > 30
     origin_to_destination_minutes = max(20.0, float(payload.distance_miles) * 1.5)
-    friday_or_saturday = payload.move_date.weekday() in (4, 5)
+    friday_or_saturday = payload.move_date.weekday() in _FRIDAY_OR_SATURDAY
 
     spec = MoveSpec(
         total_weight_lbs=total_weight_lbs,
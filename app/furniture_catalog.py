@@ -1,31 +1,11 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, List, Tuple
 
 from .catalog import Catalog, MatchResult
-
-
-@dataclass
-class FurnitureLineItem:
-    item_id: str
-    name: str
-    quantity: int
-    weight_each_lbs: float
-
-    @property
-    def total_weight_lbs(self) -> float:
-        return round(self.weight_each_lbs * self.quantity, 2)
-
-    def as_dict(self) -> Dict[str, object]:
-        return {
-            "item_id": self.item_id,
-            "name": self.name,
-            "quantity": self.quantity,
-            "weight_each_lbs": round(self.weight_each_lbs, 2),
-            "weight_total_lbs": self.total_weight_lbs,
-        }
+from .text_utils import MAX_CACHED_TEXT_LENGTH
 
 
 class FurnitureCatalog:
@@ -33,6 +13,7 @@ class FurnitureCatalog:
 
     def __init__(self, catalog_path: str | Path):
         self._catalog = Catalog(catalog_path)
+        self._cached_total_weight = lru_cache(maxsize=2048)(self._compute_total_weight)
 
     def _match(self, key: str) -> MatchResult:
         match = self._catalog.match(key, similarity_threshold=0.85)
@@ -41,20 +22,34 @@ class FurnitureCatalog:
         return match
 
     def total_weight(self, order: Dict[str, int]) -> Tuple[float, List[Dict[str, object]]]:
-        total_weight = 0.0
+        # Keyed on insertion order, which fixes both the summation and tie-break order.
+        # Zero-quantity lines are never priced, so they stay out of the key.
+        key = tuple((name, quantity) for name, quantity in order.items() if quantity > 0)
+        if any(len(name) > MAX_CACHED_TEXT_LENGTH for name, _ in key):
+            total, breakdown = self._compute_total_weight(key)
+        else:
+            total, breakdown = self._cached_total_weight(key)
+        return total, [dict(entry) for entry in breakdown]
+
+    def _compute_total_weight(
+        self, order: Tuple[Tuple[str, int], ...]
+    ) -> Tuple[float, Tuple[Dict[str, object], ...]]:
+        line_totals: List[float] = []
         breakdown: List[Dict[str, object]] = []
-        for raw_name, qty in order.items():
-            quantity = int(qty)
-            if quantity <= 0:
-                continue
-            match = self._match(str(raw_name))
-            item = FurnitureLineItem(
-                item_id=match.item["id"],
-                name=match.item["name"],
-                quantity=quantity,
-                weight_each_lbs=float(match.item["weight_lbs"]),
+        for raw_name, quantity in order:
+            # Raises on the first unknown item.
+            item = self._match(raw_name).item
+            weight = float(item["weight_lbs"])
+            line_total = round(weight * quantity, 2)
+            line_totals.append(line_total)
+            breakdown.append(
+                {
+                    "item_id": item["id"],
+                    "name": item["name"],
+                    "quantity": quantity,
+                    "weight_each_lbs": round(weight, 2),
+                    "weight_total_lbs": line_total,
+                }
             )
-            total_weight += item.total_weight_lbs
-            breakdown.append(item.as_dict())
         breakdown.sort(key=lambda entry: entry["name"].lower())
-        return round(total_weight, 2), breakdown
+        return round(sum(line_totals), 2), tuple(breakdown)
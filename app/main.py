@@ -4,6 +4,7 @@ from datetime import datetime
 from pathlib import Path
 
 from fastapi import FastAPI, Response
+from fastapi.responses import ORJSONResponse
 
 from .estimate_routes import router as estimate_router
 from .metrics import CONTENT_TYPE_LATEST, generate_latest
@@ -13,7 +14,7 @@ BASE_DIR = Path(__file__).resolve().parent.parent
 CATALOG_PATH = BASE_DIR / "data" / "estimation_weights_volumes_categories.json"
 RULES_PATH = BASE_DIR / "data" / "moving_rules.json"
 
-app = FastAPI(title="Estimate Moving Price", version=APP_VERSION)
+app = FastAPI(title="Estimate Moving Price", version=APP_VERSION, default_response_class=ORJSONResponse)
 app.include_router(estimate_router)
 
 
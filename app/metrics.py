@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import threading
 from typing import Dict, Iterable, List, Tuple
 
 CONTENT_TYPE_LATEST = "text/plain; version=0.0.4; charset=utf-8"
@@ -8,11 +9,18 @@ _REGISTRY: List["_MetricBase"] = []
 
 
 class _MetricBase:
-    def __init__(self, name: str, documentation: str, labelnames: Iterable[str] | None = None):
+    def __init__(
+        self, name: str, documentation: str, labelnames: Iterable[str] | None = None, *, register: bool = True
+    ):
         self.name = name
         self.documentation = documentation
         self.labelnames: Tuple[str, ...] = tuple(labelnames or ())
-        _REGISTRY.append(self)
+        # Labelled children share the parent's storage and are reused per label set.
+        self._children: Dict[Tuple[str, ...], "_MetricBase"] = {}
+        # Quotes are computed on worker threads while /metrics scrapes on the event loop.
+        self._lock = threading.Lock()
+        if register:
+            _REGISTRY.append(self)
 
     def _validate_labels(self, labels: Dict[str, str]) -> Tuple[str, ...]:
         if set(labels.keys()) != set(self.labelnames):
@@ -35,26 +43,34 @@ class _MetricBase:
 
 
 class Counter(_MetricBase):
-    def __init__(self, name: str, documentation: str, labelnames: Iterable[str] | None = None):
-        super().__init__(name, documentation, labelnames)
+    def __init__(
+        self, name: str, documentation: str, labelnames: Iterable[str] | None = None, *, register: bool = True
+    ):
+        super().__init__(name, documentation, labelnames, register=register)
         self._values: Dict[Tuple[str, ...], float] = {}
 
     def inc(self, amount: float = 1.0) -> None:
         self._increment((), amount)
 
     def _increment(self, key: Tuple[str, ...], amount: float) -> None:
-        self._values[key] = self._values.get(key, 0.0) + amount
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
 
     def labels(self, **labels: str) -> "Counter":
         key = self._validate_labels(labels)
-        child = Counter(self.name, self.documentation, self.labelnames)
-        child._values = self._values
-        child._increment = lambda _, amount: self._increment(key, amount)
-        child.labels = lambda **_: child
+        child = self._children.get(key)
+        if child is None:
+            child = Counter(self.name, self.documentation, self.labelnames, register=False)
+            child._values = self._values
+            child._increment = lambda _, amount: self._increment(key, amount)
+            child.labels = lambda **_: child
+            self._children[key] = child
         return child
 
     def samples(self):
-        for key, value in self._values.items():
+        with self._lock:
+            snapshot = list(self._values.items())
+        for key, value in snapshot:
             labels = dict(zip(self.labelnames, key)) if self.labelnames else {}
             yield self.name, labels, value
 
@@ -64,8 +80,16 @@ class Counter(_MetricBase):
 
 
 class Histogram(_MetricBase):
-    def __init__(self, name: str, documentation: str, buckets: Iterable[float], labelnames: Iterable[str] | None = None):
-        super().__init__(name, documentation, labelnames)
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        buckets: Iterable[float],
+        labelnames: Iterable[str] | None = None,
+        *,
+        register: bool = True,
+    ):
+        super().__init__(name, documentation, labelnames, register=register)
         self._buckets = tuple(sorted(buckets))
         if not self._buckets or self._buckets[-1] != float("inf"):
             self._buckets += (float("inf"),)
@@ -76,24 +100,30 @@ class Histogram(_MetricBase):
         self._observe((), value)
 
     def _observe(self, key: Tuple[str, ...], value: float) -> None:
-        counts = self._counts.setdefault(key, [0 for _ in self._buckets])
-        for idx, upper in enumerate(self._buckets):
-            if value <= upper:
-                counts[idx] += 1
-                break
-        self._sums[key] = self._sums.get(key, 0.0) + value
+        with self._lock:
+            counts = self._counts.setdefault(key, [0 for _ in self._buckets])
+            for idx, upper in enumerate(self._buckets):
+                if value <= upper:
+                    counts[idx] += 1
+                    break
+            self._sums[key] = self._sums.get(key, 0.0) + value
 
     def labels(self, **labels: str) -> "Histogram":
         key = self._validate_labels(labels)
-        child = Histogram(self.name, self.documentation, self._buckets, self.labelnames)
-        child._counts = self._counts
-        child._sums = self._sums
-        child._observe = lambda _, value: self._observe(key, value)
-        child.labels = lambda **_: child
+        child = self._children.get(key)
+        if child is None:
+            child = Histogram(self.name, self.documentation, self._buckets, self.labelnames, register=False)
+            child._counts = self._counts
+            child._sums = self._sums
+            child._observe = lambda _, value: self._observe(key, value)
+            child.labels = lambda **_: child
+            self._children[key] = child
         return child
 
     def samples(self):
-        for key, counts in self._counts.items():
+        with self._lock:
+            snapshot = [(key, list(counts), self._sums.get(key, 0.0)) for key, counts in self._counts.items()]
+        for key, counts, total in snapshot:
             labels = dict(zip(self.labelnames, key)) if self.labelnames else {}
             cumulative = 0
             for idx, upper in enumerate(self._buckets):
@@ -102,7 +132,7 @@ class Histogram(_MetricBase):
                 bucket_labels["le"] = "+Inf" if upper == float("inf") else str(upper)
                 yield f"{self.name}_bucket", bucket_labels, cumulative
             yield f"{self.name}_count", labels, cumulative
-            yield f"{self.name}_sum", labels, self._sums.get(key, 0.0)
+            yield f"{self.name}_sum", labels, total
 
     @property
     def type(self) -> str:
@@ -62,8 +62,8 @@ def record_quote_error() -> None:
     QUOTE_ERROR.inc()
 
 
-def record_alias_hit(approximate: bool) -> None:
-    ALIAS_HIT_RATE.labels(approximate=str(approximate)).inc()
+def record_alias_hit(approximate: bool, count: int = 1) -> None:
+    ALIAS_HIT_RATE.labels(approximate=str(approximate)).inc(count)
 
 
 def record_unknown_item() -> None:
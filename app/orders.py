@@ -21,6 +21,11 @@ from pydantic import BaseModel, field_validator
 
 router = APIRouter()
 
+_SPOKEN_AT = re.compile(r"\s*(?:\[?at\]?|\(at\)| at )\s*")
+_SPOKEN_DOT = re.compile(r"\s*(?:\[?dot\]?|\(dot\)| dot )\s*")
+_WHITESPACE = re.compile(r"\s+")
+_RECIPIENT_SEP = re.compile(r"[,;\s]+")
+
 
 class OrderEmailRequest(BaseModel):
     item_details: str
@@ -41,9 +46,9 @@ class OrderEmailRequest(BaseModel):
             return value
 
         normalized = value.strip().lower()
-        normalized = re.sub(r"\s*(?:\[?at\]?|\(at\)| at )\s*", "@", normalized)
-        normalized = re.sub(r"\s*(?:\[?dot\]?|\(dot\)| dot )\s*", ".", normalized)
-        normalized = re.sub(r"\s+", "", normalized)
+        normalized = _SPOKEN_AT.sub("@", normalized)
+        normalized = _SPOKEN_DOT.sub(".", normalized)
+        normalized = _WHITESPACE.sub("", normalized)
         return normalized
 
     @field_validator("email", mode="before")
@@ -73,7 +78,7 @@ class EmailConfig(BaseModel):
         recipients_raw = os.getenv("ORDER_EMAIL_RECIPIENTS", "")
         recipients = [
             addr.strip()
-            for addr in re.split(r"[,;\s]+", recipients_raw)
+            for addr in _RECIPIENT_SEP.split(recipients_raw)
             if addr and addr.strip()
         ]
         if not recipients:
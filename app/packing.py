@@ -5,6 +5,9 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import Dict, Optional
 
+_NAME_SPLIT = re.compile(r"(?<=\d)(?=[A-Za-z])")
+_NUMBER = re.compile(r"[0-9]+(?:\.[0-9]+)?")
+
 
 @dataclass(frozen=True)
 class PackingSku:
@@ -40,11 +43,11 @@ class PackingCatalog:
             return
         header = lines[0]
         for line in lines[1:]:
-            parts = re.split(r"(?<=\d)(?=[A-Za-z])", line)
+            parts = _NAME_SPLIT.split(line)
             if not parts:
                 continue
             name_part = parts[0].strip()
-            numeric = re.findall(r"[0-9]+(?:\.[0-9]+)?", line)
+            numeric = _NUMBER.findall(line)
             if len(numeric) < 3:
                 continue
             box_rate = float(numeric[-2])
@@ -89,7 +92,7 @@ class PackingCatalog:
         for key, code in self._BOX_CODE_MAP.items():
             if key in lowered:
                 return code
-        digits = re.findall(r"[0-9]+(?:\.[0-9]+)?", lowered)
+        digits = _NUMBER.findall(lowered)
         if digits:
             return digits[0]
         return None
@@ -3,7 +3,7 @@ from __future__ import annotations
 import math
 from dataclasses import dataclass, field
 from datetime import date
-from math import ceil
+from functools import cached_property
 from typing import Dict, List, Optional
 
 from .catalog import CatalogItem, MatchResult
@@ -11,13 +11,13 @@ from .packing import PackingCatalog
 from .rules import AccessRule, MovingRules
 
 
-@dataclass
+@dataclass(slots=True)
 class LocationContext:
     raw: Dict[str, int | float | bool | str]
     access_rule: AccessRule
 
 
-@dataclass
+@dataclass(slots=True)
 class ItemAllocation:
     match: MatchResult
     quantity: int
@@ -57,16 +57,17 @@ class QuoteContext:
     options: QuoteOptions
     notes: List[str] = field(default_factory=list)
 
-    @property
+    # Allocations are fixed once the context is built; every candidate reads these.
+    @cached_property
     def total_weight(self) -> float:
         return sum(item.total_weight for item in self.allocations)
 
-    @property
+    @cached_property
     def total_volume(self) -> float:
         return sum(item.total_volume for item in self.allocations)
 
 
-@dataclass
+@dataclass(slots=True)
 class QuoteResult:
     movers: int
     trucks: int
@@ -97,7 +98,7 @@ def compute_site_adjustments_minutes(location: dict, rules: MovingRules) -> floa
     minutes += stairs * rules.stairs_minutes_per_flight
     long_carry = max(int(location.get("long_carry_feet") or 0), 0)
     if long_carry > 0 and rules.long_carry_minutes_per_50ft:
-        minutes += math.ceil(long_carry / 50) * rules.long_carry_minutes_per_50ft
+        minutes += -(-long_carry // 50) * rules.long_carry_minutes_per_50ft
     if location.get("elevator"):
         minutes += rules.elevator_minutes
     return minutes
@@ -130,9 +131,20 @@ def protective_materials_charge(total_weight: float) -> float:
     return units * 5.0
 
 
-def evaluate_candidate(movers: int, trucks: int, ctx: QuoteContext) -> QuoteResult:
-    total_weight = ctx.total_weight
-    work_hours = compute_productivity_hours(total_weight, movers, ctx.origin, ctx.destination)
+@dataclass(slots=True)
+class CandidateInputs:
+    travel_hours: float
+    mover_rate: float
+    truck_rate: float
+    adjustment_minutes: float
+    packing_cost: float
+    packing_time_hours: float
+    mileage_cost: float
+    surcharges: List[Dict[str, float]]
+    surcharge_total: float
+
+
+def candidate_inputs(ctx: QuoteContext) -> CandidateInputs:
     travel_hours = ctx.rules.travel_charge_hours
     if ctx.distance_miles < 30:
         travel_hours += ctx.rules.local_extra_minutes_under_30_miles / 60.0
@@ -143,17 +155,46 @@ def evaluate_candidate(movers: int, trucks: int, ctx: QuoteContext) -> QuoteResu
     truck_rate = float(rate_card.truck_rate_per_hour)
     adjustment_minutes = compute_site_adjustments_minutes(ctx.origin.raw, ctx.rules) + compute_site_adjustments_minutes(ctx.destination.raw, ctx.rules)
     packing_cost, packing_time_hours = compute_packing(ctx, mover_rate)
-    total_hours = work_hours + travel_hours + (adjustment_minutes / 60.0) + packing_time_hours
-    billable_hours = max(ctx.rules.min_billable_hours, total_hours)
-    labor_hourly = mover_rate * movers + truck_rate * trucks
-    labor_cost = labor_hourly * billable_hours
     mileage_cost = ctx.distance_miles * ctx.rules.mileage_rate
     surcharges = []
-    protective_charge = protective_materials_charge(total_weight)
+    protective_charge = protective_materials_charge(ctx.total_weight)
     if protective_charge:
         surcharges.append({"type": "protective_materials", "amount": round(protective_charge, 2)})
+    return CandidateInputs(
+        travel_hours=travel_hours,
+        mover_rate=mover_rate,
+        truck_rate=truck_rate,
+        adjustment_minutes=adjustment_minutes,
+        packing_cost=packing_cost,
+        packing_time_hours=packing_time_hours,
+        mileage_cost=mileage_cost,
+        surcharges=surcharges,
+        surcharge_total=sum(s["amount"] for s in surcharges),
+    )
+
+
+def evaluate_candidate(
+    movers: int,
+    trucks: int,
+    ctx: QuoteContext,
+    inputs: Optional[CandidateInputs] = None,
+    work_hours: Optional[float] = None,
+) -> QuoteResult:
+    if inputs is None:
+        inputs = candidate_inputs(ctx)
+    if work_hours is None:
+        work_hours = compute_productivity_hours(ctx.total_weight, movers, ctx.origin, ctx.destination)
+    travel_hours = inputs.travel_hours
+    adjustment_minutes = inputs.adjustment_minutes
+    packing_cost = inputs.packing_cost
+    packing_time_hours = inputs.packing_time_hours
+    total_hours = work_hours + travel_hours + (adjustment_minutes / 60.0) + packing_time_hours
+    billable_hours = max(ctx.rules.min_billable_hours, total_hours)
+    labor_hourly = inputs.mover_rate * movers + inputs.truck_rate * trucks
+    labor_cost = labor_hourly * billable_hours
+    mileage_cost = inputs.mileage_cost
     discounts: List[Dict[str, float]] = []
-    subtotal = labor_cost + mileage_cost + packing_cost + sum(s["amount"] for s in surcharges)
+    subtotal = labor_cost + mileage_cost + packing_cost + inputs.surcharge_total
     total_price = subtotal + ctx.rules.base_fee
     if ctx.options.not_to_exceed:
         total_price *= (1 + ctx.rules.nte_buffer_percent)
@@ -165,7 +206,7 @@ def evaluate_candidate(movers: int, trucks: int, ctx: QuoteContext) -> QuoteResu
         mileage_cost=mileage_cost,
         packing_cost=packing_cost,
         travel_hours=travel_hours,
-        surcharges=surcharges,
+        surcharges=[dict(surcharge) for surcharge in inputs.surcharges],
         discounts=discounts,
         total_price=total_price,
         work_hours=work_hours,
@@ -191,14 +232,17 @@ def optimize(ctx: QuoteContext) -> tuple[QuoteResult, int]:
         extra = total_weight - baseline
         min_for_weight += math.ceil(extra / step)
     min_movers = max(min_movers, min_for_weight)
-    min_trucks = max(1, ceil(total_weight / ctx.rules.truck_capacity_lbs))
+    min_trucks = max(1, math.ceil(total_weight / ctx.rules.truck_capacity_lbs))
     best: Optional[QuoteResult] = None
     candidate_count = 0
     max_trucks = max(ctx.rules.max_trucks, min_trucks)
+    inputs = candidate_inputs(ctx)
     for movers in range(min_movers, max_movers + 1):
+        # Productivity depends only on the crew size, not the truck count.
+        work_hours = compute_productivity_hours(total_weight, movers, ctx.origin, ctx.destination)
         for trucks in range(min_trucks, max_trucks + 1):
             candidate_count += 1
-            quote = evaluate_candidate(movers, trucks, ctx)
+            quote = evaluate_candidate(movers, trucks, ctx, inputs, work_hours)
             if best is None or quote.total_price < best.total_price:
                 best = quote
     if best is None:
@@ -3,6 +3,7 @@ from __future__ import annotations
 import math
 from dataclasses import dataclass
 from enum import Enum
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict
 
@@ -28,7 +29,7 @@ class LocationProfile(str, Enum):
         return {"location_type": "house", "floor": 1, "stairs_flights": 0}
 
 
-@dataclass
+@dataclass(frozen=True)
 class MoveSpec:
     total_weight_lbs: float
     location_profile: LocationProfile
@@ -38,10 +39,17 @@ class MoveSpec:
     distance_miles: float
 
 
+@lru_cache(maxsize=1)
 def _load_rules() -> MovingRules:
     return load_rules(RULES_PATH)
 
 
+def reload_rules() -> None:
+    """Re-read moving_rules.json and drop quotes priced with the old rules."""
+    _load_rules.cache_clear()
+    _compute_quote_cached.cache_clear()
+
+
 def _build_location(profile: LocationProfile, rules: MovingRules) -> LocationContext:
     access = rules.access_rules.get(profile.access_code())
     if not access:
@@ -50,6 +58,12 @@ def _build_location(profile: LocationProfile, rules: MovingRules) -> LocationCon
 
 
 def compute_quote(spec: MoveSpec) -> Dict[str, object]:
+    # Callers decorate the returned dict, so hand out a copy of the cached quote.
+    return dict(_compute_quote_cached(spec))
+
+
+@lru_cache(maxsize=8192)
+def _compute_quote_cached(spec: MoveSpec) -> Dict[str, object]:
     rules = _load_rules()
     origin_ctx = _build_location(spec.location_profile, rules)
     destination_ctx = _build_location(spec.location_profile, rules)
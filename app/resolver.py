@@ -7,7 +7,7 @@ from difflib import SequenceMatcher
 from typing import Dict, List, Optional, Sequence, Tuple
 
 from .catalog import AliasRecord, Catalog, CatalogItem, MatchResult
-from .text_utils import normalize_label, tokenize, trigram_vector, cosine_similarity
+from .text_utils import TrigramVector, normalize_label, tokenize, trigram_vector, cosine_similarity
 
 
 BOX_ID_MAP = {
@@ -85,7 +85,7 @@ CATEGORY_TOKEN_MAP = {
 }
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ResolverOptions:
     resolver_policy: str = "best_match_no_fail"
     box_allocation_policy: str = "50/35/10/5"
@@ -93,7 +93,7 @@ class ResolverOptions:
     assumptions_public: bool = True
 
 
-@dataclass
+@dataclass(slots=True)
 class Candidate:
     record: AliasRecord
     score: float
@@ -102,7 +102,7 @@ class Candidate:
     weight: float
 
 
-@dataclass
+@dataclass(slots=True)
 class ResolvedLine:
     raw: str
     quantity: int
@@ -180,13 +180,10 @@ def _partial_ratio(left: str, right: str) -> float:
     return SequenceMatcher(None, left, right).ratio()
 
 
-def _bed_majority(counter: Counter[str]) -> Optional[str]:
+def _bed_majority(entries: Sequence[Tuple[str, int, str, Sequence[str]]]) -> Optional[str]:
     votes = {size: 0 for size in BED_SIZE_ORDER}
-    for raw, qty in counter.items():
-        normalized = normalize_label(raw)
-        if not normalized:
-            continue
-        tokens = set(tokenize(normalized))
+    for _raw, qty, _norm, token_list in entries:
+        tokens = set(token_list)
         if not tokens & {"mattress", "mattres"}:
             continue
         for size, synonyms in BED_SIZE_SYNONYMS.items():
@@ -241,7 +238,7 @@ def _build_family_line(raw: str, quantity: int, catalog: Catalog, item_id: str,
     match = MatchResult(
         item=item,
         alias=item["name"],
-        normalized=normalize_label(item["name"]),
+        normalized=catalog.normalized_name(item["id"]),
         similarity=0.9,
         approximate=True,
     )
@@ -257,7 +254,7 @@ def _family_dresser(raw: str, tokens: Sequence[str], quantity: int, catalog: Cat
             match = MatchResult(
                 item=item,
                 alias=item["name"],
-                normalized=normalize_label(item["name"]),
+                normalized=catalog.normalized_name(item["id"]),
                 similarity=0.85,
                 approximate=True,
             )
@@ -273,7 +270,7 @@ def _family_dresser(raw: str, tokens: Sequence[str], quantity: int, catalog: Cat
         match = MatchResult(
             item=item,
             alias=item["name"],
-            normalized=normalize_label(item["name"]),
+            normalized=catalog.normalized_name(item["id"]),
             similarity=0.82,
             approximate=True,
         )
@@ -311,7 +308,7 @@ def _family_piano(
         match = MatchResult(
             item=item,
             alias=item["name"],
-            normalized=normalize_label(item["name"]),
+            normalized=catalog.normalized_name(item["id"]),
             similarity=confidence,
             approximate=True,
         )
@@ -330,7 +327,7 @@ def _family_piano(
             bench_match = MatchResult(
                 item=bench_item,
                 alias=bench_item["name"],
-                normalized=normalize_label(bench_item["name"]),
+                normalized=catalog.normalized_name(bench_item["id"]),
                 similarity=0.8,
                 approximate=True,
             )
@@ -383,7 +380,7 @@ def _apply_boxes(
         match = MatchResult(
             item=item,
             alias=item["name"],
-            normalized=normalize_label(item["name"]),
+            normalized=catalog.normalized_name(item["id"]),
             similarity=0.9,
             approximate=False,
         )
@@ -399,10 +396,22 @@ def _apply_boxes(
     return lines
 
 
-def _candidate_score(norm: str, record: AliasRecord) -> float:
+def _partial_ratio_upper_bound(left: str, right: str) -> float:
+    # Same bound as SequenceMatcher.real_quick_ratio(), without building a matcher.
+    total = len(left) + len(right)
+    if not left or not right:
+        return 0.0
+    return 2.0 * min(len(left), len(right)) / total
+
+
+def _candidate_score(norm: str, vector: TrigramVector, record: AliasRecord, floor: float = 0.0) -> float:
     token_ratio = _token_set_ratio(norm, record.normalized)
+    cosine = cosine_similarity(vector, record.vector)
+    # The difflib ratio dominates the cost; skip it (scoring 0.0) when even its
+    # upper bound cannot lift the candidate to the floor.
+    if (token_ratio + _partial_ratio_upper_bound(norm, record.normalized) + cosine) / 3.0 < floor:
+        return 0.0
     partial_ratio = _partial_ratio(norm, record.normalized)
-    cosine = cosine_similarity(trigram_vector(norm), record.vector)
     return (token_ratio + partial_ratio + cosine) / 3.0
 
 
@@ -453,7 +462,7 @@ def _category_backstop(
     match = MatchResult(
         item=item,
         alias=item["name"],
-        normalized=normalize_label(item["name"]),
+        normalized=catalog.normalized_name(item["id"]),
         similarity=0.5,
         approximate=True,
     )
@@ -482,14 +491,17 @@ def resolve_inventory(
     assumptions: List[dict] = []
     lines: List[ResolvedLine] = []
     size_applied: Dict[str, set] = {}
-    bed_size = _bed_majority(counter)
-    for raw, quantity in counter.items():
+    entries = [
+        (raw, quantity, norm, tokenize(norm))
+        for raw, quantity in counter.items()
+        if (norm := normalize_label(raw))
+    ]
+    # The bed-size vote only feeds family mapping, which exact matches never reach.
+    bed_size: Optional[str] = None
+    bed_size_known = False
+    for raw, quantity, norm, tokens in entries:
         if quantity <= 0:
             continue
-        norm = normalize_label(raw)
-        if not norm:
-            continue
-        tokens = tokenize(norm)
         if norm == "box":
             lines.extend(_apply_boxes(raw, quantity, catalog, options, assumptions))
             continue
@@ -498,7 +510,7 @@ def resolve_inventory(
             match = MatchResult(
                 item=direct_item,
                 alias=direct_item["name"],
-                normalized=normalize_label(direct_item["name"]),
+                normalized=catalog.normalized_name(direct_item["id"]),
                 similarity=1.0,
                 approximate=False,
             )
@@ -512,18 +524,16 @@ def resolve_inventory(
                 )
             )
             continue
-        alias_id = catalog.alias_to_id.get(norm)
-        if alias_id:
-            item = catalog.get(alias_id)
-            record = catalog.get_alias_record(norm)
-            alias_name = record.alias if record else item["name"]
+        alias_record = catalog.get_alias_record(norm)
+        if alias_record:
+            item = catalog.get(alias_record.item_id)
             lines.append(
                 ResolvedLine(
                     raw=raw,
                     quantity=quantity,
                     match=MatchResult(
                         item=item,
-                        alias=alias_name,
+                        alias=alias_record.alias,
                         normalized=norm,
                         similarity=0.98,
                         approximate=False,
@@ -533,6 +543,9 @@ def resolve_inventory(
                 )
             )
             continue
+        if not bed_size_known:
+            bed_size = _bed_majority(entries)
+            bed_size_known = True
         family_lines = _family_bed_mapping(raw, tokens, quantity, catalog, bed_size, size_applied)
         if family_lines:
             lines.extend(family_lines)
@@ -547,11 +560,12 @@ def resolve_inventory(
             continue
         candidates: List[Candidate] = []
         category_hint = infer_category(tokens)
+        vector = trigram_vector(norm)
         for record in catalog.alias_records():
-            score = _candidate_score(norm, record)
-            coverage = _candidate_coverage(tokens, record)
+            score = _candidate_score(norm, vector, record, options.confidence_floor)
             if score < options.confidence_floor:
                 continue
+            coverage = _candidate_coverage(tokens, record)
             item = catalog.get(record.item_id)
             candidates.append(
                 Candidate(
@@ -1,10 +1,25 @@
 from __future__ import annotations
 
-import json
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import date
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, Tuple
+
+import orjson
+
+# Indexed by date.weekday(); Saturday and Sunday bill at the weekend rate.
+_RATE_GROUP_BY_WEEKDAY = (
+    "ratesMondayToThursday",
+    "ratesMondayToThursday",
+    "ratesMondayToThursday",
+    "ratesMondayToThursday",
+    "ratesMondayToThursday",
+    "ratesFridayToSaturday",
+    "ratesFridayToSaturday",
+)
+
+_HOUSE_TYPES = frozenset({"house", "townhouse"})
+_UNIT_TYPES = frozenset({"apartment", "condo"})
 
 
 @dataclass(frozen=True)
@@ -39,21 +54,32 @@ class MovingRules:
     base_fee: float
     nte_buffer_percent: float
     rate_cards: Dict[str, Dict[str, RateCard]]
+    # is_local -> rate card per date.weekday(), resolved once from rate_cards.
+    _rate_table: Dict[bool, Tuple[RateCard, ...]] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self._rate_table = {}
+        for is_local, move_type in ((True, "localMoves"), (False, "intrastateMoves")):
+            cards = self.rate_cards.get(move_type, {})
+            missing = sorted(set(_RATE_GROUP_BY_WEEKDAY) - cards.keys())
+            if missing:
+                raise ValueError(f"Rate cards for {move_type} are missing: {', '.join(missing)}")
+            self._rate_table[is_local] = tuple(cards[group] for group in _RATE_GROUP_BY_WEEKDAY)
 
     def access_for_location(self, location: Dict[str, Any]) -> AccessRule:
         location_type = (location.get("location_type") or "").lower()
         floor = int(location.get("floor") or 1)
         stairs = int(location.get("stairs_flights") or 0)
         elevator = bool(location.get("elevator"))
-        if location_type in {"dock"}:
+        if location_type == "dock":
             return self.access_rules["1E"]
-        if location_type in {"storage"}:
+        if location_type == "storage":
             return self.access_rules["1D"]
-        if location_type in {"house", "townhouse"}:
+        if location_type in _HOUSE_TYPES:
             if stairs > 0:
                 return self.access_rules["1A"]
             return self.access_rules["1C"]
-        if location_type in {"apartment", "condo"}:
+        if location_type in _UNIT_TYPES:
             if floor > 1 and not elevator:
                 return self.access_rules["1B"]
             if floor > 1 and elevator:
@@ -63,17 +89,14 @@ class MovingRules:
         return self.access_rules["1C"]
 
     def rate_card_for(self, move_date: date, *, is_local: bool) -> RateCard:
-        weekday = move_date.weekday()
-        weekend = weekday >= 5
-        move_type = "localMoves" if is_local else "intrastateMoves"
-        rate_group = "ratesFridayToSaturday" if weekend else "ratesMondayToThursday"
-        return self.rate_cards[move_type][rate_group]
+        return self._rate_table[is_local][move_date.weekday()]
 
 
 def load_rules(path: str | Path) -> MovingRules:
-    path = Path(path)
-    with path.open("r", encoding="utf-8") as fh:
-        payload = json.load(fh)
+    return build_rules(orjson.loads(Path(path).read_bytes()))
+
+
+def build_rules(payload: Dict[str, Any]) -> MovingRules:
     ctx = payload["movingQuoterContext"]
     access_rules = {
         sub["subrule"]: AccessRule(
@@ -3,10 +3,13 @@ from __future__ import annotations
 import datetime as dt
 import re
 from collections import Counter
+from functools import lru_cache
 from typing import Any, Dict, List, Optional
 
 from pydantic import BaseModel, ConfigDict, Field, model_validator
 
+from .text_utils import MAX_CACHED_TEXT_LENGTH
+
 BOX_SIZE_KEYS = ["1.5", "3.0", "4.5", "6.0", "wardrobe", "tv", "mirror"]
 BOX_SYNONYMS = {
     "small box": "1.5",
@@ -20,6 +23,11 @@ BOX_SYNONYMS = {
     "flat screen": "tv",
     "mirror box": "mirror",
 }
+# Canonical size keys win over synonyms that share the same spelling.
+_CARTON_CODES = {**BOX_SYNONYMS, **{key: key for key in BOX_SIZE_KEYS}}
+# Accepted spellings for list-of-object items, in priority order (see README).
+_NAME_KEYS = ("item", "items", "name", "id")
+_QTY_KEYS = ("quantity", "Qty", "qty")
 BOX_DISTRIBUTION = {
     "1.5": 0.5,
     "3.0": 0.35,
@@ -42,23 +50,19 @@ class LocationModel(BaseModel):
 class PackingCartons(BaseModel):
     model_config = ConfigDict(extra="ignore")
 
-    cartons: Dict[str, int] = Field(default_factory=lambda: {key: 0 for key in BOX_SIZE_KEYS})
+    cartons: Dict[str, int] = Field(default_factory=lambda: dict.fromkeys(BOX_SIZE_KEYS, 0))
 
     @model_validator(mode="before")
     @classmethod
     def normalize(cls, value: Any) -> Dict[str, int]:
         if value is None:
-            return {key: 0 for key in BOX_SIZE_KEYS}
+            return dict.fromkeys(BOX_SIZE_KEYS, 0)
         if isinstance(value, dict):
-            normalized: Dict[str, int] = {key: 0 for key in BOX_SIZE_KEYS}
+            normalized: Dict[str, int] = dict.fromkeys(BOX_SIZE_KEYS, 0)
             for raw_key, raw_val in value.items():
-                key = str(raw_key).lower()
-                if key in BOX_SIZE_KEYS:
-                    normalized[key] = int(raw_val)
-                else:
-                    mapped = BOX_SYNONYMS.get(key)
-                    if mapped:
-                        normalized[mapped] = int(raw_val)
+                mapped = _CARTON_CODES.get(str(raw_key).lower())
+                if mapped:
+                    normalized[mapped] = int(raw_val)
             return normalized
         raise ValueError("cartons must be an object")
 
@@ -91,7 +95,7 @@ class QuoteOptions(BaseModel):
 class EstimateRequest(BaseModel):
     model_config = ConfigDict(extra="ignore")
 
-    items: List[str] = Field(default_factory=list)
+    items: Dict[str, int] = Field(default_factory=dict)
     distance_miles: float = Field(..., ge=0)
     move_date: dt.date
     origin: LocationModel = Field(default_factory=LocationModel)
@@ -118,8 +122,8 @@ class EstimateRequest(BaseModel):
         elif isinstance(raw_items, list):
             if raw_items and all(isinstance(elem, dict) for elem in raw_items):
                 for elem in raw_items:
-                    name = elem.get("item") or elem.get("name")
-                    qty = elem.get("quantity") or elem.get("Qty") or 1
+                    name = _first_truthy(elem, _NAME_KEYS)
+                    qty = _first_truthy(elem, _QTY_KEYS) or 1
                     if name:
                         counts[str(name)] += int(qty)
             else:
@@ -129,27 +133,19 @@ class EstimateRequest(BaseModel):
                     elif isinstance(elem, dict) and "name" in elem:
                         counts[str(elem["name"])] += int(elem.get("quantity") or 1)
         elif isinstance(raw_items, str):
-            for piece in raw_items.split(","):
-                piece = piece.strip()
-                if not piece:
-                    continue
-                if ":" in piece:
-                    name, qty = piece.split(":", 1)
-                    try:
-                        counts[name.strip()] += int(qty.strip())
-                    except ValueError:
-                        counts[name.strip()] += 1
-                else:
-                    counts[piece] += 1
+            parse = _parse_items_string
+            if len(raw_items) > MAX_CACHED_TEXT_LENGTH:
+                parse = _parse_items_string.__wrapped__
+            for name, qty in parse(raw_items):
+                counts[name] += qty
         if isinstance(qty_multiplier, int) and qty_multiplier > 1 and counts:
             for key in list(counts.keys()):
                 counts[key] *= qty_multiplier
-        expanded: List[str] = []
-        for name, qty in counts.items():
-            expanded.extend([name] * max(int(qty), 0))
-        value["items"] = expanded
+        value["items"] = {name: qty for name, qty in counts.items() if qty > 0}
         if "move_date" in value and not isinstance(value["move_date"], dt.date):
-            value["move_date"] = _coerce_date(value["move_date"])
+            # Canonical YYYY-MM-DD strings are left to pydantic-core's date parser.
+            if not _is_iso_date(value["move_date"]):
+                value["move_date"] = _coerce_date(value["move_date"])
         return value
 
     def items_counter(self) -> Counter[str]:
@@ -169,13 +165,56 @@ class EstimateResponse(BaseModel):
     calculation_logic: Optional[Dict[str, Any]] = None
 
 
+def _first_truthy(entry: Dict[str, Any], keys: tuple[str, ...]) -> Any:
+    for key in keys:
+        value = entry.get(key)
+        if value:
+            return value
+    return None
+
+
+def _is_iso_date(value: Any) -> bool:
+    return (
+        isinstance(value, str)
+        and len(value) == 10
+        and value.isascii()
+        and value[4] == "-"
+        and value[7] == "-"
+        and value[:4].isdigit()
+        and value[5:7].isdigit()
+        and value[8:].isdigit()
+    )
+
+
 def _coerce_date(value: Any) -> dt.date:
     if isinstance(value, dt.date):
         return value
     if isinstance(value, dt.datetime):
         return value.date()
-    string = str(value).strip().replace("/", "-")
-    return dt.date.fromisoformat(string)
+    return _parse_date_string(str(value))
+
+
+@lru_cache(maxsize=256)
+def _parse_items_string(raw: str) -> tuple[tuple[str, int], ...]:
+    pairs: List[tuple[str, int]] = []
+    for piece in raw.split(","):
+        piece = piece.strip()
+        if not piece:
+            continue
+        if ":" in piece:
+            name, qty = piece.split(":", 1)
+            try:
+                pairs.append((name.strip(), int(qty.strip())))
+            except ValueError:
+                pairs.append((name.strip(), 1))
+        else:
+            pairs.append((piece, 1))
+    return tuple(pairs)
+
+
+@lru_cache(maxsize=1024)
+def _parse_date_string(value: str) -> dt.date:
+    return dt.date.fromisoformat(value.strip().replace("/", "-"))
 
 
 def distribute_boxes(total: int) -> Dict[str, int]:
@@ -198,6 +237,9 @@ BOX_TOTAL_PATTERN = re.compile(r"(~|about)?\s*(\d+)\s+boxes?", re.IGNORECASE)
 
 
 def detect_box_total(item_name: str) -> Optional[int]:
+    # The pattern needs the literal "boxe" (from "boxes?"); skip the regex without it.
+    if "boxe" not in item_name.lower():
+        return None
     match = BOX_TOTAL_PATTERN.search(item_name)
     if match:
         return int(match.group(2))
@@ -2,12 +2,13 @@ from __future__ import annotations
 
 import hashlib
 import hmac
-import json
 import threading
 import time
+from collections import OrderedDict
 from dataclasses import dataclass
-from typing import Any, Callable, Optional
+from typing import Any, Callable, Dict, Optional
 
+import orjson
 from fastapi import HTTPException
 
 try:  # pragma: no cover - optional dependency
@@ -19,6 +20,8 @@ except Exception:  # pragma: no cover - optional dependency
 class HMACVerifier:
     def __init__(self, secret: str):
         self._secret = secret.encode("utf-8")
+        # Keyed once; verify() copies it instead of redoing the HMAC key setup.
+        self._prototype = hmac.new(self._secret, digestmod=hashlib.sha256)
 
     def verify(self, header: Optional[str], payload: bytes) -> None:
         if not self._secret:
@@ -26,7 +29,9 @@ class HMACVerifier:
         if not header or not header.startswith("sha256="):
             raise HTTPException(status_code=401, detail="Missing or invalid signature header")
         provided = header.split("=", 1)[1]
-        digest = hmac.new(self._secret, payload, hashlib.sha256).hexdigest()
+        mac = self._prototype.copy()
+        mac.update(payload)
+        digest = mac.hexdigest()
         if not hmac.compare_digest(provided, digest):
             raise HTTPException(status_code=401, detail="Signature mismatch")
 
@@ -34,17 +39,23 @@ class HMACVerifier:
 @dataclass
 class IdempotencyRecord:
     body_hash: str
-    response_json: str
+    response_json: bytes
     created_at: float
 
 
 class IdempotencyStore:
-    def __init__(self, redis_url: Optional[str], ttl_seconds: int = 86400):
+    # How long a claimed key blocks duplicates if its worker dies before storing a response.
+    _PENDING_TTL_SECONDS = 60
+
+    def __init__(self, redis_url: Optional[str], ttl_seconds: int = 86400, max_local_entries: int = 10000):
         self._ttl = ttl_seconds
         self._redis = None
         if redis_url and redis is not None:
             self._redis = redis.Redis.from_url(redis_url)
-        self._local: dict[str, IdempotencyRecord] = {}
+        self._max_local_entries = max_local_entries
+        self._local: OrderedDict[str, IdempotencyRecord] = OrderedDict()
+        # Local keys whose first request is still computing, mapped to its body hash.
+        self._pending: Dict[str, str] = {}
         self._lock = threading.Lock()
 
     def _make_key(self, key: str) -> str:
@@ -59,23 +70,51 @@ class IdempotencyStore:
         body_hash = hashlib.sha256(body).hexdigest()
         if self._redis:
             namespaced = self._make_key(key)
-            existing = self._redis.get(namespaced)
+            # SET NX GET (Redis 7+) claims the key and reads any existing record in one round-trip.
+            claim = orjson.dumps({"body_hash": body_hash, "pending": True})
+            existing = self._redis.set(namespaced, claim, nx=True, ex=self._PENDING_TTL_SECONDS, get=True)
             if existing:
-                record = json.loads(existing.decode("utf-8"))
+                record = orjson.loads(existing)
                 if record["body_hash"] != body_hash:
                     raise HTTPException(status_code=409, detail="Idempotency conflict")
-                return json.loads(record["response_json"])
-            response = compute()
-            payload = json.dumps({"body_hash": body_hash, "response_json": json.dumps(response)})
+                if record.get("pending"):
+                    raise HTTPException(status_code=409, detail="Idempotent request still in progress")
+                if "response" not in record:  # records written before responses were nested
+                    return orjson.loads(record["response_json"])
+                return record["response"]
+            try:
+                response = compute()
+            except BaseException:
+                self._redis.delete(namespaced)
+                raise
+            payload = orjson.dumps({"body_hash": body_hash, "response": response})
             self._redis.setex(namespaced, self._ttl, payload)
             return response
         with self._lock:
             record = self._local.get(key)
-            now = self._now()
-            if record and now - record.created_at < self._ttl:
+            if record and self._now() - record.created_at < self._ttl:
                 if record.body_hash != body_hash:
                     raise HTTPException(status_code=409, detail="Idempotency conflict")
-                return json.loads(record.response_json)
+                self._local.move_to_end(key)
+                return orjson.loads(record.response_json)
+            pending_hash = self._pending.get(key)
+            if pending_hash is not None:
+                if pending_hash != body_hash:
+                    raise HTTPException(status_code=409, detail="Idempotency conflict")
+                raise HTTPException(status_code=409, detail="Idempotent request still in progress")
+            self._pending[key] = body_hash
+        # Compute outside the lock so requests with other keys are not serialized behind this one.
+        try:
             response = compute()
-            self._local[key] = IdempotencyRecord(body_hash=body_hash, response_json=json.dumps(response), created_at=now)
-            return response
+        except BaseException:
+            with self._lock:
+                self._pending.pop(key, None)
+            raise
+        response_json = orjson.dumps(response)
+        with self._lock:
+            self._pending.pop(key, None)
+            self._local[key] = IdempotencyRecord(body_hash=body_hash, response_json=response_json, created_at=self._now())
+            self._local.move_to_end(key)
+            if len(self._local) > self._max_local_entries:
+                self._local.popitem(last=False)
+        return response
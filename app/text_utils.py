@@ -4,14 +4,15 @@ import re
 import unicodedata
 from functools import lru_cache
 from collections import Counter
-from collections import Counter
-from typing import Iterable, List, Sequence
+from dataclasses import dataclass
+from typing import Dict, FrozenSet, Iterable, List, Sequence
 
-import re
-import unicodedata
+# Longer client strings skip the memo caches so they cannot pin large inputs in memory.
+MAX_CACHED_TEXT_LENGTH = 256
 
 _WORD_SEP = re.compile(r"\s+")
 _NON_ALNUM = re.compile(r"[^a-z0-9 ]+")
+_SEPARATORS = str.maketrans("_-", "  ")
 _PAIR_REORDER = {
     ("small", "box"): ("box", "1.5"),
     ("medium", "box"): ("box", "3.0"),
@@ -22,6 +23,9 @@ _PAIR_REORDER = {
 
 
 def _ascii_fold(text: str) -> str:
+    # ASCII is unchanged by NFKD and has no combining marks.
+    if text.isascii():
+        return text
     normalized = unicodedata.normalize("NFKD", text)
     return "".join(char for char in normalized if not unicodedata.combining(char))
 
@@ -39,26 +43,30 @@ def _is_numeric(token: str) -> bool:
 
 
 def singularize(token: str) -> str:
-    if not token or _is_numeric(token):
+    # Every plural suffix below ends in "s", so most tokens exit here.
+    if len(token) <= 3 or token[-1] != "s" or _is_numeric(token):
         return token
-    if token.endswith("ies") and len(token) > 3:
+    if token.endswith("ies"):
         return token[:-3] + "y"
-    if token.endswith("ves") and len(token) > 3:
+    if token.endswith("ves"):
         return token[:-3] + "f"
-    if token.endswith("ses") and len(token) > 3:
+    if token.endswith(("ses", "xes")):
         return token[:-2]
-    if token.endswith("xes") and len(token) > 3:
-        return token[:-2]
-    if token.endswith("s") and len(token) > 3:
-        return token[:-1]
-    return token
+    return token[:-1]
 
 
 def normalize_label(raw: str) -> str:
     if raw is None:
         return ""
+    if len(raw) > MAX_CACHED_TEXT_LENGTH:
+        return _normalize_label.__wrapped__(raw)
+    return _normalize_label(raw)
+
+
+@lru_cache(maxsize=4096)
+def _normalize_label(raw: str) -> str:
     working = _ascii_fold(raw.lower().strip())
-    working = working.replace("_", " ").replace("-", " ")
+    working = working.translate(_SEPARATORS)
     working = _NON_ALNUM.sub(" ", working)
     tokens = [token for token in _WORD_SEP.split(working) if token]
     if not tokens:
@@ -80,27 +88,35 @@ def generate_tokens(normalized: str) -> List[str]:
     return tokens + bigrams
 
 
-def trigram_vector(normalized: str) -> Counter[str]:
+@dataclass(frozen=True)
+class TrigramVector:
+    counts: Dict[str, int]
+    keys: FrozenSet[str]
+    norm: float
+
+    @classmethod
+    def from_counts(cls, counts: Dict[str, int]) -> "TrigramVector":
+        norm = sum(value * value for value in counts.values()) ** 0.5
+        return cls(counts=counts, keys=frozenset(counts), norm=norm)
+
+
+def trigram_vector(normalized: str) -> TrigramVector:
     padded = f" {normalized} " if normalized else ""
     if len(padded) < 3:
-        return Counter({padded: 1}) if padded else Counter()
-    return Counter(padded[idx : idx + 3] for idx in range(len(padded) - 2))
+        return TrigramVector.from_counts(Counter({padded: 1}) if padded else Counter())
+    return TrigramVector.from_counts(Counter(padded[idx : idx + 3] for idx in range(len(padded) - 2)))
 
 
-def cosine_similarity(vec_a: dict[str, int], vec_b: dict[str, int]) -> float:
-    if not vec_a or not vec_b:
+def cosine_similarity(vec_a: TrigramVector, vec_b: TrigramVector) -> float:
+    if not vec_a.norm or not vec_b.norm:
         return 0.0
-    intersection = set(vec_a) & set(vec_b)
+    intersection = vec_a.keys & vec_b.keys
     if not intersection:
         return 0.0
-    dot = sum(vec_a[key] * vec_b[key] for key in intersection)
+    dot = sum(vec_a.counts[key] * vec_b.counts[key] for key in intersection)
     if not dot:
         return 0.0
-    norm_a = sum(value * value for value in vec_a.values()) ** 0.5
-    norm_b = sum(value * value for value in vec_b.values()) ** 0.5
-    if not norm_a or not norm_b:
-        return 0.0
-    return dot / (norm_a * norm_b)
+    return dot / (vec_a.norm * vec_b.norm)
 
 
 def stable_sort(values: Iterable[str]) -> List[str]:
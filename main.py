@@ -1,17 +1,20 @@
 from __future__ import annotations
 
-import json
+import hashlib
 import os
+import secrets
 import time
-import uuid
 from collections import Counter
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, List
 
-from fastapi import FastAPI, HTTPException, Request, Response
+import orjson
+from fastapi import FastAPI, HTTPException, Query, Request, Response
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import ORJSONResponse
 from app.metrics import CONTENT_TYPE_LATEST, generate_latest
-from pydantic import ValidationError
+from pydantic import TypeAdapter, ValidationError
 
 from app.catalog import Catalog
 from app.observability import (
@@ -32,7 +35,7 @@ from app.pricing import (
     QuoteResult,
     optimize,
 )
-from app.rules import load_rules
+from app.rules import build_rules
 from app.resolver import ResolverOptions, resolve_inventory, allocate_boxes
 from app.schemas import EstimateRequest, EstimateResponse, detect_box_total
 from app.security import HMACVerifier, IdempotencyStore
@@ -45,63 +48,73 @@ RULES_PATH = BASE_DIR / "data" / "moving_rules.json"
 PACKING_PATH = BASE_DIR / "data" / "packing_weight_volume_pricing.tsv"
 
 catalog = Catalog(CATALOG_PATH)
-with RULES_PATH.open("r", encoding="utf-8") as fh:
-    rules_payload = json.load(fh)
-rules = load_rules(RULES_PATH)
+rules_payload = orjson.loads(RULES_PATH.read_bytes())
+rules = build_rules(rules_payload)
+_BASE_FEE = round(rules.base_fee, 2)
 packing_catalog = PackingCatalog(tsv_path=PACKING_PATH, json_config=rules_payload["movingQuoterContext"])
 
 hmac_secret = os.getenv("HMAC_SECRET", "")
 verifier = HMACVerifier(hmac_secret)
-idempotency_store = IdempotencyStore(os.getenv("REDIS_URL"))
+idempotency_store = IdempotencyStore(
+    os.getenv("REDIS_URL"), max_local_entries=int(os.getenv("IDEMP_MAX", "10000"))
+)
 allow_internal_debug = os.getenv("ALLOW_INTERNAL_DEBUG", "false").lower() in {"1", "true", "yes"}
+max_batch_size = int(os.getenv("ESTIMATE_BATCH_MAX", "50"))
 
-api = FastAPI(title="Estimate Moving Price", version=APP_VERSION)
+api = FastAPI(title="Estimate Moving Price", version=APP_VERSION, default_response_class=ORJSONResponse)
 api.include_router(orders_router)
 
 
-def _hash_file(path: Path) -> str:
-    data = path.read_bytes()
-    return str(abs(hash(data)))
-
-
-@api.get("/healthz", include_in_schema=False)
-def healthz():
-    return {
+# The catalog and rules are loaded once at import, so the health payload is fixed
+# for the life of the process.
+_HEALTHZ_BODY = orjson.dumps(
+    {
         "status": "ok",
-        "catalog_hash": _hash_file(CATALOG_PATH),
-        "rules_hash": _hash_file(RULES_PATH),
+        "catalog_hash": hashlib.sha256(CATALOG_PATH.read_bytes()).hexdigest(),
+        "rules_hash": hashlib.sha256(RULES_PATH.read_bytes()).hexdigest(),
         "version": APP_VERSION,
     }
+)
+
+
+@api.get("/healthz", include_in_schema=False)
+async def healthz():
+    return Response(_HEALTHZ_BODY, media_type="application/json")
 
 
 @api.get("/metrics", include_in_schema=False)
-def metrics():
+async def metrics():
     return Response(generate_latest(), media_type=CONTENT_TYPE_LATEST)
 
 
-def _resolve_cartons(base: Dict[str, int], additions: Dict[str, int]) -> Dict[str, int]:
-    result = dict(base)
-    for key, value in additions.items():
-        result[key] = result.get(key, 0) + value
-    return result
+@api.get("/suggest")
+async def suggest(q: str = Query(..., min_length=1, max_length=200), limit: int = Query(5, ge=1, le=20)):
+    # Catalog suggestions run outside /estimate; the trigram scan goes to the threadpool.
+    matches = await run_in_threadpool(catalog.suggest, q, limit=limit)
+    return {
+        "query": q,
+        "suggestions": [
+            {"item_id": match.item["id"], "name": match.item["name"], "similarity": round(match.similarity, 4)}
+            for match in matches
+        ],
+    }
 
 
 def _resolve_items(
     req: EstimateRequest, resolver_options: ResolverOptions
 ) -> tuple[List[ItemAllocation], List[str], Dict[str, int], List[Dict[str, Any]], List[dict], Dict[str, Any]]:
     notes: List[str] = []
-    cartons = req.packing.cartons_dict()
+    cartons: Counter[str] = Counter(req.packing.cartons_dict())
     with span("normalize_items"):
         raw_counts = req.items_counter()
     counter: Counter[str] = Counter()
+    # EstimateRequest.normalize already drops non-positive quantities.
     for raw_name, qty in raw_counts.items():
-        if qty <= 0:
-            continue
         detected_total = detect_box_total(raw_name)
         if detected_total:
             distribution = allocate_boxes(detected_total, resolver_options.box_allocation_policy)
             scaled_distribution = {key: value * qty for key, value in distribution.items()}
-            cartons = _resolve_cartons(cartons, scaled_distribution)
+            cartons.update(scaled_distribution)
             counter["box"] += detected_total * qty
             notes.append(
                 f"Converted {detected_total * qty} boxes into distribution {scaled_distribution} from '{raw_name}'"
@@ -111,34 +124,35 @@ def _resolve_items(
     with span("resolve_inventory"):
         resolver_result = resolve_inventory(counter, catalog, resolver_options)
     allocations_map: Dict[str, Dict[str, Any]] = {}
+    alias_hits: Counter[bool] = Counter()
     for line in resolver_result.lines:
-        record_alias_hit(line.match.approximate)
+        alias_hits[line.match.approximate] += 1
         entry = allocations_map.setdefault(
             line.match.item["id"], {"match": line.match, "quantity": 0}
         )
         entry["quantity"] += line.quantity
-    sorted_ids = sorted(allocations_map.keys())
-    allocations = [
-        ItemAllocation(match=allocations_map[item_id]["match"], quantity=allocations_map[item_id]["quantity"])
-        for item_id in sorted_ids
-    ]
-    inventory_breakdown = [
-        {
-            "item_id": item_id,
-            "name": allocations_map[item_id]["match"].item["name"],
-            "quantity": allocations_map[item_id]["quantity"],
-            "weight_each_lbs": allocations_map[item_id]["match"].item["weight_lbs"],
-            "weight_total_lbs": round(
-                allocations_map[item_id]["match"].item["weight_lbs"]
-                * allocations_map[item_id]["quantity"],
-                2,
-            ),
-        }
-        for item_id in sorted_ids
-    ]
-    inventory_breakdown.sort(key=lambda entry: entry["name"].lower())
+    for approximate, hits in alias_hits.items():
+        record_alias_hit(approximate, hits)
+    allocations: List[ItemAllocation] = []
+    inventory_breakdown: List[Dict[str, Any]] = []
+    for item_id, entry in sorted(
+        allocations_map.items(), key=lambda pair: (pair[1]["match"].item["name"].lower(), pair[0])
+    ):
+        match = entry["match"]
+        quantity = entry["quantity"]
+        weight_each = match.item["weight_lbs"]
+        allocations.append(ItemAllocation(match=match, quantity=quantity))
+        inventory_breakdown.append(
+            {
+                "item_id": item_id,
+                "name": match.item["name"],
+                "quantity": quantity,
+                "weight_each_lbs": weight_each,
+                "weight_total_lbs": round(weight_each * quantity, 2),
+            }
+        )
     assumptions = resolver_result.assumptions if resolver_options.assumptions_public else []
-    return allocations, notes, cartons, inventory_breakdown, assumptions, resolver_result.match_summary
+    return allocations, notes, dict(cartons), inventory_breakdown, assumptions, resolver_result.match_summary
 
 
 def _location_context(raw: Dict[str, Any]) -> LocationContext:
@@ -156,8 +170,9 @@ def _build_quote_response(
     match_summary: Dict[str, Any],
     include_trace: bool,
 ) -> tuple[Dict[str, Any], QuoteResult, int]:
-    origin_ctx = _location_context(req.origin.model_dump())
-    destination_ctx = _location_context(req.destination.model_dump())
+    # LocationModel fields are all scalars, so a shallow copy equals model_dump().
+    origin_ctx = _location_context(dict(req.origin.__dict__))
+    destination_ctx = _location_context(dict(req.destination.__dict__))
     options = QuoteOptions(
         optimize_for=req.options.optimize_for,
         not_to_exceed=req.options.not_to_exceed,
@@ -182,24 +197,20 @@ def _build_quote_response(
     labor_cost = round(quote.labor_cost, 2)
     mileage_cost = round(quote.mileage_cost, 2)
     packing_cost = round(quote.packing_cost, 2)
-    surcharges = [
-        {"type": item["type"], "amount": round(item["amount"], 2)} for item in quote.surcharges
-    ]
+    # candidate_inputs already rounds surcharge amounts to cents.
+    surcharges = quote.surcharges
     discounts = [
         {"type": item["type"], "amount": round(item["amount"], 2)} for item in quote.discounts
     ]
-    base_fee = rules.base_fee
     line_items = [
         {"type": "labor", "amount": labor_cost},
         {"type": "mileage", "amount": mileage_cost},
     ]
     if packing_cost:
         line_items.append({"type": "packing", "amount": packing_cost})
-    if surcharges:
-        for surcharge in surcharges:
-            line_items.append({"type": surcharge["type"], "amount": surcharge["amount"]})
-    if base_fee:
-        line_items.append({"type": "base_fee", "amount": round(base_fee, 2)})
+    line_items.extend(dict(surcharge) for surcharge in surcharges)
+    if rules.base_fee:
+        line_items.append({"type": "base_fee", "amount": _BASE_FEE})
     breakdown_public = {
         "labor_hours_billed": round(quote.billable_hours, 2),
         "movers": quote.movers,
@@ -222,7 +233,7 @@ def _build_quote_response(
         "total_volume": ctx.total_volume,
     }
     response_payload = {
-        "quote_id": f"q_{uuid.uuid4().hex[:10]}",
+        "quote_id": f"q_{secrets.token_hex(5)}",
         "final_price": final_price,
         "currency": "USD",
         "breakdown_public": breakdown_public,
@@ -237,17 +248,55 @@ def _build_quote_response(
     return response_payload, quote, candidates
 
 
+def _generate_quote(payload: EstimateRequest, include_trace: bool, started: float) -> Dict[str, Any]:
+    resolver_options = ResolverOptions(
+        resolver_policy=payload.options.resolver_policy,
+        box_allocation_policy=payload.options.box_allocation_policy,
+        confidence_floor=float(payload.options.confidence_floor),
+        assumptions_public=payload.options.assumptions_public,
+    )
+    (
+        allocations,
+        notes,
+        cartons,
+        inventory_breakdown,
+        assumptions,
+        match_summary,
+    ) = _resolve_items(payload, resolver_options)
+    response_payload, quote, candidates = _build_quote_response(
+        payload,
+        allocations,
+        notes,
+        cartons,
+        inventory_breakdown,
+        assumptions,
+        match_summary,
+        include_trace,
+    )
+    latency_ms = (time.perf_counter() - started) * 1000
+    record_quote_success(latency_ms, candidates, quote.movers, quote.trucks)
+    structured_log(
+        "quote.generated",
+        quote_id=response_payload["quote_id"],
+        hashed_items=hash_items(payload.items_counter().elements()),
+        match_summary=match_summary,
+        movers=quote.movers,
+        trucks=quote.trucks,
+    )
+    return response_payload
+
+
 @api.post("/estimate", response_model=EstimateResponse)
 async def estimate(request: Request):
     raw_body = await request.body()
     verifier.verify(request.headers.get("X-Signature"), raw_body)
-    request_start = time.time()
+    request_start = time.perf_counter()
     with span("apply_rules"):
         try:
             payload = EstimateRequest.model_validate_json(raw_body)
         except ValidationError as exc:
             record_quote_error()
-            raise HTTPException(status_code=422, detail=json.loads(exc.json())) from exc
+            raise HTTPException(status_code=422, detail=orjson.loads(exc.json())) from exc
         except Exception as exc:
             record_quote_error()
             raise HTTPException(status_code=400, detail=str(exc)) from exc
@@ -256,48 +305,76 @@ async def estimate(request: Request):
     include_trace = allow_internal_debug and debug_header
 
     def compute() -> Dict[str, Any]:
-        resolver_options = ResolverOptions(
-            resolver_policy=payload.options.resolver_policy,
-            box_allocation_policy=payload.options.box_allocation_policy,
-            confidence_floor=float(payload.options.confidence_floor),
-            assumptions_public=payload.options.assumptions_public,
-        )
-        (
-            allocations,
-            notes,
-            cartons,
-            inventory_breakdown,
-            assumptions,
-            match_summary,
-        ) = _resolve_items(payload, resolver_options)
-        response_payload, quote, candidates = _build_quote_response(
-            payload,
-            allocations,
-            notes,
-            cartons,
-            inventory_breakdown,
-            assumptions,
-            match_summary,
-            include_trace,
-        )
-        latency_ms = (time.time() - request_start) * 1000
-        record_quote_success(latency_ms, candidates, quote.movers, quote.trucks)
-        structured_log(
-            "quote.generated",
-            quote_id=response_payload["quote_id"],
-            hashed_items=hash_items(payload.items),
-            match_summary=match_summary,
-            movers=quote.movers,
-            trucks=quote.trucks,
-        )
-        return response_payload
+        return _generate_quote(payload, include_trace, request_start)
 
     try:
-        response = idempotency_store.get_or_set(idempotency_key, raw_body, compute)
+        # Redis round-trips and the quote search block; keep them off the event loop.
+        response = await run_in_threadpool(idempotency_store.get_or_set, idempotency_key, raw_body, compute)
     except HTTPException:
         record_quote_error()
         raise
     except Exception as exc:  # pragma: no cover
         record_quote_error()
         raise
-    return EstimateResponse.model_validate(response)
+    return response
+
+
+_BATCH_ADAPTER = TypeAdapter(List[EstimateRequest])
+
+
+@api.post("/estimate/batch", response_model=List[EstimateResponse])
+async def estimate_batch(request: Request):
+    raw_body = await request.body()
+    verifier.verify(request.headers.get("X-Signature"), raw_body)
+    with span("apply_rules"):
+        # Reject oversized batches on the cheap decoded length, before validating every entry.
+        try:
+            raw_batch: Any = orjson.loads(raw_body)
+        except orjson.JSONDecodeError:
+            raw_batch = None
+        if isinstance(raw_batch, list) and not 0 < len(raw_batch) <= max_batch_size:
+            record_quote_error()
+            raise HTTPException(status_code=400, detail=f"Batch must contain between 1 and {max_batch_size} estimates")
+        try:
+            if isinstance(raw_batch, list):
+                payloads = _BATCH_ADAPTER.validate_python(raw_batch)
+            else:
+                # Let pydantic report malformed JSON and non-array bodies as usual.
+                payloads = _BATCH_ADAPTER.validate_json(raw_body)
+        except ValidationError as exc:
+            record_quote_error()
+            raise HTTPException(status_code=422, detail=orjson.loads(exc.json())) from exc
+        except Exception as exc:
+            record_quote_error()
+            raise HTTPException(status_code=400, detail=str(exc)) from exc
+    debug_header = (request.headers.get("X-Debug") or "").lower() == "true"
+    include_trace = allow_internal_debug and debug_header
+
+    def compute_all() -> List[Dict[str, Any]]:
+        return [_generate_quote(payload, include_trace, time.perf_counter()) for payload in payloads]
+
+    try:
+        # One threadpool hop for the whole batch.
+        return await run_in_threadpool(compute_all)
+    except Exception:
+        record_quote_error()
+        raise
+
+
+_WARM_UP_BODY = b'{"items": {"sofa": 1, "dining chair": 4}, "distance_miles": 12, "move_date": "2025-06-02"}'
+
+
+def _warm_up() -> None:
+    # Exercise validation, resolution and pricing once so the first real request
+    # does not pay for lazy initialisation. Metrics and quote logs are bypassed.
+    payload = EstimateRequest.model_validate_json(_WARM_UP_BODY)
+    result = resolve_inventory(payload.items_counter(), catalog, ResolverOptions())
+    allocations = [ItemAllocation(match=line.match, quantity=line.quantity) for line in result.lines]
+    _build_quote_response(payload, allocations, [], {}, [], [], result.match_summary, False)
+
+
+if os.getenv("WARM_ON_START", "1") == "1":
+    try:
+        _warm_up()
+    except Exception as exc:  # pragma: no cover - warm-up must never block startup
+        structured_log("warm_up.failed", error=str(exc))
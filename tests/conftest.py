@@ -1,6 +1,49 @@
+import asyncio
 import sys
 from pathlib import Path
 
+import orjson
+import pytest
+
 PROJECT_ROOT = Path(__file__).resolve().parent.parent
 if str(PROJECT_ROOT) not in sys.path:
     sys.path.insert(0, str(PROJECT_ROOT))
+
+from app.catalog import Catalog  # noqa: E402
+from app.packing import PackingCatalog  # noqa: E402
+from app.rules import MovingRules, build_rules  # noqa: E402
+
+DATA_DIR = PROJECT_ROOT / "data"
+CATALOG_PATH = DATA_DIR / "estimation_weights_volumes_categories.json"
+RULES_PATH = DATA_DIR / "moving_rules.json"
+PACKING_PATH = DATA_DIR / "packing_weight_volume_pricing.tsv"
+
+
+@pytest.fixture(scope="session")
+def catalog() -> Catalog:
+    return Catalog(CATALOG_PATH)
+
+
+@pytest.fixture(scope="session")
+def rules_payload() -> dict:
+    return orjson.loads(RULES_PATH.read_bytes())
+
+
+@pytest.fixture(scope="session")
+def rules(rules_payload) -> MovingRules:
+    return build_rules(rules_payload)
+
+
+@pytest.fixture(scope="session")
+def packing_catalog(rules_payload) -> PackingCatalog:
+    return PackingCatalog(
+        tsv_path=PACKING_PATH,
+        json_config=rules_payload["movingQuoterContext"],
+    )
+
+
+@pytest.fixture(scope="session")
+def run_async():
+    loop = asyncio.new_event_loop()
+    yield loop.run_until_complete
+    loop.close()
@@ -2,7 +2,12 @@ import hashlib
 import hashlib
 import hmac
 import asyncio
+import json
 
+import pytest
+from fastapi import HTTPException, Request
+
+import main
 from app.estimate_routes import EstimateRequest, create_estimate
 
 
@@ -21,3 +26,50 @@ def test_estimate_endpoint_success():
     assert data["billable_hours"] >= 3.0
     assert data["movers"] >= 2
     assert data["inventory_breakdown"]
+
+
+def _post(body: bytes) -> Request:
+    async def receive():
+        return {"type": "http.request", "body": body, "more_body": False}
+
+    return Request({"type": "http", "method": "POST", "headers": []}, receive)
+
+
+def test_estimate_batch_returns_one_quote_per_request():
+    body = json.dumps(
+        [
+            {"items": {"sofa": 1, "dining chair": 4}, "distance_miles": 12, "move_date": "2025-06-02"},
+            {"items": ["queen mattress", "dresser"], "distance_miles": 45, "move_date": "2025-06-07"},
+        ]
+    ).encode()
+    quotes = asyncio.run(main.estimate_batch(_post(body)))
+    assert len(quotes) == 2
+    assert all(quote["final_price"] > 0 for quote in quotes)
+    assert quotes[0]["quote_id"] != quotes[1]["quote_id"]
+
+
+def test_estimate_batch_rejects_empty_batch():
+    with pytest.raises(HTTPException) as exc:
+        asyncio.run(main.estimate_batch(_post(b"[]")))
+    assert exc.value.status_code == 400
+
+
+def test_estimate_batch_rejects_oversized_batch_before_validation():
+    # Entries are invalid on purpose: the size check must fire first.
+    body = json.dumps([{"items": 42}] * (main.max_batch_size + 1)).encode()
+    with pytest.raises(HTTPException) as exc:
+        asyncio.run(main.estimate_batch(_post(body)))
+    assert exc.value.status_code == 400
+
+
+def test_suggest_returns_ranked_catalog_items():
+    data = asyncio.run(main.suggest("fridgee", limit=3))
+    assert data["query"] == "fridgee"
+    assert 0 < len(data["suggestions"]) <= 3
+    assert data["suggestions"][0]["name"].lower().startswith("refrigerator")
+
+
+def test_estimate_router_is_served_by_app_main():
+    from app.main import app
+
+    assert "/estimate" in {route.path for route in app.routes}
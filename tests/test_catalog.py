@@ -1,7 +1,8 @@
 from pathlib import Path
 
 from app.catalog import Catalog
-from app.text_utils import normalize_label
+from app.furniture_catalog import FurnitureCatalog
+from app.text_utils import MAX_CACHED_TEXT_LENGTH, _normalize_label, normalize_label
 
 CATALOG_PATH = Path(__file__).resolve().parent.parent / "data" / "estimation_weights_volumes_categories.json"
 
@@ -23,3 +24,33 @@ def test_unknown_item_suggestions():
     suggestions = catalog.suggest("fridgee")
     assert suggestions
     assert suggestions[0].item["name"].lower().startswith("refrigerator")
+
+
+def test_match_resolves_item_ids_exactly():
+    catalog = get_catalog()
+    for raw in ("sofa_three_seat", "Sofa-Three-Seat"):
+        match = catalog.match(raw)
+        assert match is not None
+        assert match.item["id"] == "sofa_three_seat"
+        assert match.similarity == 1.0
+        assert not match.approximate
+
+
+def test_long_labels_are_not_cached():
+    catalog = get_catalog()
+    raw = "dining table " * (MAX_CACHED_TEXT_LENGTH // 10)
+    before = _normalize_label.cache_info().currsize
+    assert normalize_label(raw) == " ".join(["dining table"] * (MAX_CACHED_TEXT_LENGTH // 10))
+    catalog.match(raw)
+    assert _normalize_label.cache_info().currsize == before
+    assert catalog._best_alias.cache_info().currsize == 0
+
+
+def test_furniture_weight_cache_skips_zero_quantities_and_long_names():
+    furniture = FurnitureCatalog(CATALOG_PATH)
+    total, _ = furniture.total_weight({"sofa": 1, "x" * 1000: 0})
+    assert furniture.total_weight({"sofa": 1})[0] == total
+    assert furniture._cached_total_weight.cache_info().currsize == 1
+    long_name = "sofa " * (MAX_CACHED_TEXT_LENGTH // 4)
+    furniture.total_weight({long_name: 1})
+    assert furniture._cached_total_weight.cache_info().currsize == 1
@@ -0,0 +1,35 @@
+from concurrent.futures import ThreadPoolExecutor
+
+from app.metrics import _REGISTRY, Counter, Histogram, generate_latest
+
+
+def test_labelled_children_are_reused_and_not_registered():
+    counter = Counter("test_labelled_total", "Labelled test counter", labelnames=("kind",))
+    histogram = Histogram("test_labelled_ms", "Labelled test histogram", buckets=(1, 10), labelnames=("kind",))
+    registered = len(_REGISTRY)
+    for _ in range(3):
+        counter.labels(kind="a").inc()
+        histogram.labels(kind="a").observe(5)
+    counter.labels(kind="b").inc(2)
+    assert len(_REGISTRY) == registered
+    assert counter.labels(kind="a") is counter.labels(kind="a")
+    output = generate_latest().decode("utf-8")
+    assert output.count('test_labelled_total{kind="a"} 3.0') == 1
+    assert output.count('test_labelled_total{kind="b"} 2.0') == 1
+    assert output.count('test_labelled_ms_count{kind="a"} 3') == 1
+
+
+def test_concurrent_updates_are_not_lost():
+    counter = Counter("test_threaded_total", "Threaded test counter", labelnames=("kind",), register=False)
+    histogram = Histogram("test_threaded_ms", "Threaded test histogram", buckets=(1, 10), register=False)
+
+    def record(_):
+        for _ in range(1000):
+            counter.labels(kind="a").inc()
+            histogram.observe(5)
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        list(pool.map(record, range(8)))
+    samples = {(name, tuple(labels.items())): value for name, labels, value in counter.samples()}
+    assert samples[("test_threaded_total", (("kind", "a"),))] == 8000
+    assert dict((name, value) for name, labels, value in histogram.samples())["test_threaded_ms_count"] == 8000
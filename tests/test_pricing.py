@@ -1,6 +1,8 @@
-import json
 from datetime import date
-from pathlib import Path
+from functools import lru_cache
+from typing import Optional
+
+import pytest
 
 from app.catalog import Catalog
 from app.packing import PackingCatalog
@@ -12,55 +14,67 @@ from app.pricing import (
     QuoteOptions,
     optimize,
 )
-from app.rules import load_rules
+from app.rules import MovingRules
 
-BASE_DIR = Path(__file__).resolve().parent.parent
-CATALOG_PATH = BASE_DIR / "data" / "estimation_weights_volumes_categories.json"
-RULES_PATH = BASE_DIR / "data" / "moving_rules.json"
-PACKING_PATH = BASE_DIR / "data" / "packing_weight_volume_pricing.tsv"
+_NO_PACKING = PackingRequest(service="none", cartons={})
+_QUOTE_OPTIONS = QuoteOptions()
 
 
-def build_context(items: list[tuple[str, int]], distance: float = 10.0) -> QuoteContext:
-    catalog = Catalog(CATALOG_PATH)
-    rules = load_rules(RULES_PATH)
-    with RULES_PATH.open("r", encoding="utf-8") as fh:
-        rules_payload = json.load(fh)
-    packing_catalog = PackingCatalog(
-        tsv_path=PACKING_PATH,
-        json_config=rules_payload["movingQuoterContext"],
-    )
-    allocations: list[ItemAllocation] = []
-    for name, quantity in items:
-        match = catalog.match(name)
-        assert match is not None, f"Catalog missing item {name}"
-        allocations.append(ItemAllocation(match=match, quantity=quantity))
-    origin_raw = {"location_type": "house", "floor": 1}
-    dest_raw = {"location_type": "house", "floor": 1}
-    origin = LocationContext(raw=origin_raw, access_rule=rules.access_for_location(origin_raw))
-    destination = LocationContext(raw=dest_raw, access_rule=rules.access_for_location(dest_raw))
-    return QuoteContext(
-        move_date=date(2025, 11, 1),
-        distance_miles=distance,
-        origin=origin,
-        destination=destination,
-        allocations=allocations,
-        rules=rules,
-        packing_catalog=packing_catalog,
-        packing_request=PackingRequest(service="none", cartons={}),
-        options=QuoteOptions(),
-    )
+@pytest.fixture(scope="session")
+def ctx_factory(catalog: Catalog, rules: MovingRules, packing_catalog: PackingCatalog):
+    location_raw = {"location_type": "house", "floor": 1}
+    location = LocationContext(raw=location_raw, access_rule=rules.access_for_location(location_raw))
+    match_item = lru_cache(maxsize=1024)(catalog.match)
 
+    def build_context(
+        items: list[tuple[str, int]],
+        distance: float = 10.0,
+        packing: Optional[PackingRequest] = None,
+    ) -> QuoteContext:
+        if packing is None:
+            packing = _NO_PACKING
+        allocations: list[ItemAllocation] = []
+        for name, quantity in items:
+            match = match_item(name)
+            assert match is not None, f"Catalog missing item {name}"
+            allocations.append(ItemAllocation(match=match, quantity=quantity))
+        return QuoteContext(
+            move_date=date(2025, 11, 1),
+            distance_miles=distance,
+            origin=location,
+            destination=location,
+            allocations=allocations,
+            rules=rules,
+            packing_catalog=packing_catalog,
+            packing_request=packing,
+            options=_QUOTE_OPTIONS,
+        )
 
-def test_minimum_hours_enforced():
-    ctx = build_context([("dining chair", 4), ("dining table", 1)])
-    quote, _ = optimize(ctx)
-    assert quote.billable_hours >= ctx.rules.min_billable_hours
-    assert quote.movers == ctx.rules.min_movers
+    return build_context
 
 
-def test_heavy_load_scales_movers_and_trucks():
-    ctx = build_context([("sofa", 4), ("refrigerator", 2), ("wardrobe", 4), ("safe", 2)], distance=40)
+@pytest.mark.parametrize(
+    "items,distance,min_movers",
+    [
+        # Light load: the minimum crew is enough.
+        ([("dining chair", 4), ("dining table", 1)], 10.0, None),
+        ([("sofa", 4), ("refrigerator", 2), ("wardrobe", 4), ("safe", 2)], 40.0, 3),
+    ],
+)
+def test_crew_scales_with_load(ctx_factory, items, distance, min_movers):
+    ctx = ctx_factory(items, distance)
     quote, _ = optimize(ctx)
-    assert quote.movers >= 3
-    assert quote.trucks >= 1
     assert quote.billable_hours >= ctx.rules.min_billable_hours
+    assert quote.trucks >= 1
+    if min_movers is None:
+        assert quote.movers == ctx.rules.min_movers
+    else:
+        assert quote.movers >= min_movers
+
+
+def test_packing_service_adds_carton_cost(ctx_factory):
+    items = [("dining chair", 4), ("dining table", 1)]
+    baseline, _ = optimize(ctx_factory(items))
+    packed, _ = optimize(ctx_factory(items, packing=PackingRequest(service="CP", cartons={"1.5": 10})))
+    assert baseline.packing_cost == 0.0
+    assert packed.packing_cost > 0.0
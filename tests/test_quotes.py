@@ -0,0 +1,19 @@
+from app import quotes
+from app.quotes import LocationProfile, MoveSpec, compute_quote, reload_rules
+
+
+def test_reload_rules_drops_cached_quotes():
+    spec = MoveSpec(
+        total_weight_lbs=2500,
+        location_profile=LocationProfile.EASY,
+        friday_or_saturday=False,
+        is_intrastate=False,
+        origin_to_destination_minutes=30,
+        distance_miles=12,
+    )
+    first = compute_quote(spec)
+    assert quotes._compute_quote_cached.cache_info().currsize >= 1
+    reload_rules()
+    assert quotes._compute_quote_cached.cache_info().currsize == 0
+    assert quotes._load_rules.cache_info().currsize == 0
+    assert compute_quote(spec) == first
@@ -1,28 +1,26 @@
-from collections import Counter
-from pathlib import Path
+from collections import Counter, defaultdict
 
-import pytest
-
-from app.catalog import Catalog
 from app.resolver import ResolverOptions, resolve_inventory
 
-CATALOG_PATH = Path(__file__).resolve().parent.parent / "data" / "estimation_weights_volumes_categories.json"
-
-
-@pytest.fixture(scope="module")
-def catalog() -> Catalog:
-    return Catalog(CATALOG_PATH)
+_DEFAULT_OPTIONS = ResolverOptions()
 
 
-def _aggregate(result) -> dict[str, int]:
-    totals: dict[str, int] = {}
+def _aggregate(result) -> Counter[str]:
+    totals: Counter[str] = Counter()
     for line in result.lines:
-        totals[line.match.item["id"]] = totals.get(line.match.item["id"], 0) + line.quantity
+        totals[line.match.item["id"]] += line.quantity
     return totals
 
 
+def _assumptions_by_type(result) -> dict[str, list[dict]]:
+    by_type: defaultdict[str, list[dict]] = defaultdict(list)
+    for entry in result.assumptions:
+        by_type[entry.get("type")].append(entry)
+    return by_type
+
+
 def test_rug_variants_resolve(catalog):
-    result = resolve_inventory(Counter({"rug_large": 1, "rug large": 1}), catalog, ResolverOptions())
+    result = resolve_inventory(Counter({"rug_large": 1, "rug large": 1}), catalog, _DEFAULT_OPTIONS)
     totals = _aggregate(result)
     assert totals.get("rug_large") == 2
     assert result.match_summary["resolved_pct"] == 100
@@ -37,41 +35,41 @@ def test_bed_family_resolution(catalog):
             "box spring": 3,
         }
     )
-    result = resolve_inventory(counter, catalog, ResolverOptions())
+    result = resolve_inventory(counter, catalog, _DEFAULT_OPTIONS)
     totals = _aggregate(result)
     assert totals.get("bed_king_headboard") == 3
     assert totals.get("bed_king_frame") == 3
     assert totals.get("bed_king_box_spring") == 3
-    size_assumptions = [entry for entry in result.assumptions if entry.get("type") == "size_inheritance"]
+    size_assumptions = _assumptions_by_type(result)["size_inheritance"]
     assert size_assumptions and size_assumptions[0]["from"] == "bed_king_mattress"
 
 
 def test_box_allocation_policy(catalog):
-    result = resolve_inventory(Counter({"box": 10}), catalog, ResolverOptions())
+    result = resolve_inventory(Counter({"box": 10}), catalog, _DEFAULT_OPTIONS)
     totals = _aggregate(result)
     assert totals.get("carton_box_small_1_5") == 5
     assert totals.get("carton_box_medium_3_0") == 3
     assert totals.get("carton_box_large_4_5") == 1
     assert totals.get("carton_box_xl_6_0") == 1
-    box_assumptions = [entry for entry in result.assumptions if entry.get("type") == "box_distribution"]
+    box_assumptions = _assumptions_by_type(result)["box_distribution"]
     assert box_assumptions and sum(box_assumptions[0]["result"].values()) == 10
 
 
 def test_fuzzy_and_backstop(catalog):
-    options = ResolverOptions()
+    options = _DEFAULT_OPTIONS
     result = resolve_inventory(Counter({"dreser": 1}), catalog, options)
     totals = _aggregate(result)
     assert totals.get("dresser_standard") == 1
-    best_matches = [entry for entry in result.assumptions if entry.get("type") == "best_match" and entry.get("raw") == "dreser"]
+    best_matches = [entry for entry in _assumptions_by_type(result)["best_match"] if entry.get("raw") == "dreser"]
     assert best_matches and best_matches[0]["confidence"] >= options.confidence_floor
 
     strict_options = ResolverOptions(confidence_floor=0.99)
     backstop = resolve_inventory(Counter({"enigmatic item": 1}), catalog, strict_options)
-    assert any(entry.get("type") == "category_backstop" for entry in backstop.assumptions)
+    assert _assumptions_by_type(backstop)["category_backstop"]
 
 
 def test_resolver_deterministic(catalog):
     counter = Counter({"dining chair": 4, "sofa": 1, "rug_large": 1})
-    first = resolve_inventory(counter, catalog, ResolverOptions())
-    second = resolve_inventory(counter, catalog, ResolverOptions())
+    first = resolve_inventory(counter, catalog, _DEFAULT_OPTIONS)
+    second = resolve_inventory(counter, catalog, _DEFAULT_OPTIONS)
     assert _aggregate(first) == _aggregate(second)
@@ -1,23 +1,24 @@
-from pathlib import Path
+import copy
 
-from app.rules import load_rules
+import pytest
 
-RULES_PATH = Path(__file__).resolve().parent.parent / "data" / "moving_rules.json"
+from app.rules import build_rules
 
 
-def get_rules():
-    return load_rules(RULES_PATH)
+@pytest.mark.parametrize(
+    "location,expected",
+    [
+        ({"location_type": "house", "stairs_flights": 2, "floor": 2}, "1A"),
+        ({"location_type": "apartment", "floor": 2, "elevator": False}, "1B"),
+        ({"location_type": "apartment", "floor": 1}, "1C"),
+    ],
+)
+def test_access_rule_selection(rules, location, expected):
+    assert rules.access_for_location(location).code == expected
 
 
-def test_access_rule_selection_house_with_stairs():
-    rules = get_rules()
-    access = rules.access_for_location({"location_type": "house", "stairs_flights": 2, "floor": 2})
-    assert access.code == "1A"
-
-
-def test_access_rule_selection_apartment_second_floor():
-    rules = get_rules()
-    access = rules.access_for_location({"location_type": "apartment", "floor": 2, "elevator": False})
-    assert access.code == "1B"
-    ground = rules.access_for_location({"location_type": "apartment", "floor": 1})
-    assert ground.code == "1C"
+def test_missing_rate_group_fails_at_load(rules_payload):
+    payload = copy.deepcopy(rules_payload)
+    payload["movingQuoterContext"]["pricing"]["localMoves"].pop("ratesFridayToSaturday")
+    with pytest.raises(ValueError, match="localMoves.*ratesFridayToSaturday"):
+        build_rules(payload)
@@ -0,0 +1,32 @@
+from app.schemas import EstimateRequest, _parse_items_string
+
+
+def test_readme_list_of_item_objects_is_normalized():
+    request = EstimateRequest.model_validate(
+        {
+            "items": [
+                {"items": "bed_king_mattress", "Qty": 1},
+                {"items": "bar_stool", "Qty": 4},
+                {"item": "bar_stool", "quantity": 2},
+                {"name": "refrigerator"},
+            ],
+            "distance_miles": 15,
+            "move_date": "2025-07-08",
+        }
+    )
+    assert request.items == {"bed_king_mattress": 1, "bar_stool": 6, "refrigerator": 1}
+
+
+def test_comma_separated_items_string_is_normalized():
+    payload = {"items": "sofa:2, bar_stool, sofa:x, , lamp:0", "distance_miles": 5, "move_date": "2025-07-08"}
+    first = EstimateRequest.model_validate(dict(payload))
+    second = EstimateRequest.model_validate(dict(payload))
+    assert first.items == second.items == {"sofa": 3, "bar_stool": 1}
+
+
+def test_long_items_string_bypasses_parse_cache():
+    raw = ",".join(["sofa"] * 100)
+    before = _parse_items_string.cache_info().currsize
+    request = EstimateRequest.model_validate({"items": raw, "distance_miles": 5, "move_date": "2025-07-08"})
+    assert request.items == {"sofa": 100}
+    assert _parse_items_string.cache_info().currsize == before
@@ -0,0 +1,94 @@
+import pytest
+from fastapi import HTTPException
+
+from app.security import IdempotencyStore
+
+
+class FakeRedis:
+    def __init__(self):
+        self.values = {}
+
+    def set(self, name, value, ex=None, nx=False, get=False):
+        existing = self.values.get(name)
+        if not (nx and existing is not None):
+            self.values[name] = value
+        return existing if get else True
+
+    def setex(self, name, ttl, value):
+        self.values[name] = value
+
+    def delete(self, name):
+        self.values.pop(name, None)
+
+
+def _redis_store() -> tuple[IdempotencyStore, FakeRedis]:
+    store = IdempotencyStore(None)
+    fake = FakeRedis()
+    store._redis = fake
+    return store, fake
+
+
+def test_redis_store_replays_response_and_rejects_conflicts():
+    store, _ = _redis_store()
+    calls = []
+
+    def compute():
+        calls.append(1)
+        return {"quote_id": "q_1"}
+
+    assert store.get_or_set("k", b"body", compute) == {"quote_id": "q_1"}
+    assert store.get_or_set("k", b"body", compute) == {"quote_id": "q_1"}
+    assert len(calls) == 1
+    with pytest.raises(HTTPException) as exc:
+        store.get_or_set("k", b"other body", compute)
+    assert exc.value.status_code == 409
+
+
+def test_redis_store_rejects_duplicate_while_first_request_runs():
+    store, _ = _redis_store()
+
+    def compute():
+        with pytest.raises(HTTPException) as exc:
+            store.get_or_set("k", b"body", lambda: {"quote_id": "dup"})
+        assert exc.value.status_code == 409
+        return {"quote_id": "q_1"}
+
+    assert store.get_or_set("k", b"body", compute) == {"quote_id": "q_1"}
+
+
+def test_redis_store_releases_claim_when_compute_fails():
+    store, fake = _redis_store()
+
+    def failing():
+        raise RuntimeError("boom")
+
+    with pytest.raises(RuntimeError):
+        store.get_or_set("k", b"body", failing)
+    assert fake.values == {}
+    assert store.get_or_set("k", b"body", lambda: {"quote_id": "q_2"}) == {"quote_id": "q_2"}
+
+
+def test_local_store_computes_other_keys_while_a_key_is_pending():
+    store = IdempotencyStore(None)
+
+    def compute():
+        # Would deadlock if the store lock were held across compute().
+        assert store.get_or_set("other", b"body", lambda: {"quote_id": "q_other"}) == {"quote_id": "q_other"}
+        with pytest.raises(HTTPException) as exc:
+            store.get_or_set("k", b"body", lambda: {"quote_id": "dup"})
+        assert exc.value.detail == "Idempotent request still in progress"
+        return {"quote_id": "q_1"}
+
+    assert store.get_or_set("k", b"body", compute) == {"quote_id": "q_1"}
+    assert store.get_or_set("k", b"body", lambda: {"quote_id": "q_2"}) == {"quote_id": "q_1"}
+
+
+def test_local_store_releases_pending_key_when_compute_fails():
+    store = IdempotencyStore(None)
+
+    def failing():
+        raise RuntimeError("boom")
+
+    with pytest.raises(RuntimeError):
+        store.get_or_set("k", b"body", failing)
+    assert store.get_or_set("k", b"body", lambda: {"quote_id": "q_2"}) == {"quote_id": "q_2"}
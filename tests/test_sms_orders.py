@@ -1,55 +1,40 @@
-import asyncio
-from typing import Any
+from unittest.mock import MagicMock
 
 import pytest
+from fastapi import HTTPException
 
 from app import orders
-from app.orders import OrderSMSRequest, sms_order
+from app.orders import OrderSMSRequest, SMSConfig, sms_order
 
 
-class DummySNS:
-    def __init__(self, region_name: str | None, access_key: str | None, secret_key: str | None):
-        self.region_name = region_name
-        self.access_key = access_key
-        self.secret_key = secret_key
-        self.published: list[dict[str, Any]] = []
+@pytest.fixture
+def boto3_mock(monkeypatch) -> MagicMock:
+    boto3 = MagicMock(spec=["client"])
+    monkeypatch.setattr(orders, "boto3", boto3, raising=False)
+    return boto3
 
-    def publish(self, **kwargs):
-        self.published.append(kwargs)
-
-
-def test_sms_order_sends(monkeypatch):
-    sns_instances: dict[str, DummySNS] = {}
-
-    def fake_sns_client(service_name: str, region_name=None, aws_access_key_id=None, aws_secret_access_key=None):
-        assert service_name == "sns"
-        sns_instances["instance"] = DummySNS(region_name, aws_access_key_id, aws_secret_access_key)
-        return sns_instances["instance"]
 
+def test_sms_order_sends(monkeypatch, run_async, boto3_mock):
     monkeypatch.setenv("ORDER_SMS_AWS_REGION", "us-west-2")
     monkeypatch.setenv("AWS_ACCESS_KEY_ID", "key-id")
     monkeypatch.setenv("AWS_SECRET_ACCESS_KEY", "secret-key")
     monkeypatch.setenv("ORDER_SMS_SENDER_ID", "MoverCo")
 
-    monkeypatch.setattr(
-        orders,
-        "boto3",
-        type("Boto3Stub", (), {"client": staticmethod(fake_sns_client)})(),
-        raising=False,
-    )
-
     payload = OrderSMSRequest(phone="+15551234567", message="Estimate ready", name="Alex Customer")
 
-    response = asyncio.run(sms_order(payload))
+    response = run_async(sms_order(payload))
     assert response == {"status": "sent", "phone": "+15551234567"}
 
-    sns = sns_instances["instance"]
-    assert sns.region_name == "us-west-2"
-    assert sns.access_key == "key-id"
-    assert sns.secret_key == "secret-key"
-    assert sns.published, "Expected an SMS to be sent"
+    boto3_mock.client.assert_called_once_with(
+        "sns",
+        region_name="us-west-2",
+        aws_access_key_id="key-id",
+        aws_secret_access_key="secret-key",
+    )
+    sns = boto3_mock.client.return_value
+    sns.publish.assert_called_once()
 
-    message = sns.published[0]
+    message = sns.publish.call_args.kwargs
     assert message["PhoneNumber"] == "+15551234567"
     assert message["Message"] == "Estimate ready"
     assert message["MessageAttributes"]["AWS.SNS.SMS.SenderID"]["StringValue"] == "MoverCo"
@@ -59,9 +44,9 @@ def test_sms_order_requires_region(monkeypatch):
     monkeypatch.delenv("ORDER_SMS_AWS_REGION", raising=False)
     monkeypatch.delenv("AWS_REGION", raising=False)
 
-    payload = OrderSMSRequest(phone="+15551234567", message="Missing config", name="Alex")
-
-    with pytest.raises(Exception) as excinfo:
-        asyncio.run(sms_order(payload))
+    # sms_order fails here, before any boto3 call, so no event loop is needed.
+    with pytest.raises(HTTPException) as excinfo:
+        SMSConfig.from_env()
 
-    assert "ORDER_SMS_AWS_REGION" in str(excinfo.value)
+    assert excinfo.value.status_code == 500
+    assert "ORDER_SMS_AWS_REGION" in str(excinfo.value.detail)